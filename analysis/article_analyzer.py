@@ -0,0 +1,196 @@
+"""
+Combined Article Analyzer
+Summary and bias report from ONE structured OpenRouter call instead of two
+separate round-trips over the same article text. The model is asked for JSON
+matching COMBINED_ANALYSIS_SCHEMA; replies are checked by a strict parser.
+
+Fallbacks:
+    - Provider rejects json_schema output -> retried once in json_object mode
+    - Reply is not valid JSON for the schema -> separate summarize() + detect_bias()
+    - API / network errors -> an error result (no extra paid calls during an outage)
+
+Articles too long for one summarization call also take the separate path,
+where summarize() map-reduces them.
+"""
+
+import json
+import re
+
+from openai import BadRequestError
+
+from analysis.bias_detector import detect_bias
+from generation.summarizer import summarize, needs_map_reduce
+from utils.prompts import (
+    BIAS_LABELS, COMBINED_SYSTEM_PROMPT, COMBINED_ANALYSIS_SCHEMA, get_combined_analysis_prompt
+)
+from utils.llm_client import get_openai_client, cached_completion
+
+COMBINED_MODEL = "openai/gpt-4o"
+
+# Used when the model answers "High" / "Medium" / "Low" instead of a number
+_CONFIDENCE_WORDS = {"high": 0.9, "medium": 0.6, "low": 0.3}
+
+_FENCE_RE = re.compile(r"^```(?:json)?\s*(.*?)\s*```$", re.DOTALL)
+
+JSON_SCHEMA_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "article_analysis", "strict": True, "schema": COMBINED_ANALYSIS_SCHEMA}
+}
+JSON_OBJECT_FORMAT = {"type": "json_object"}
+
+
+def parse_combined_analysis(content):
+    """
+    Strictly parses a combined analysis reply.
+
+    Args:
+        content: Raw model reply (a JSON object, optionally in a ``` fence)
+
+    Returns:
+        dict: summary, bias (label / confidence / analysis, as detect_bias()
+              returns it) and observations
+
+    Raises:
+        ValueError: If the reply is not JSON matching COMBINED_ANALYSIS_SCHEMA
+    """
+    content = (content or '').strip()
+    fenced = _FENCE_RE.match(content)
+    if fenced:
+        content = fenced.group(1)
+
+    try:
+        data = json.loads(content)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Reply is not JSON: {e}") from e
+    if not isinstance(data, dict):
+        raise ValueError("Reply is not a JSON object")
+
+    summary = data.get('summary')
+    if not isinstance(summary, str) or not summary.strip():
+        raise ValueError("Missing summary")
+
+    labels = {label.lower(): label for label in BIAS_LABELS}
+    label = labels.get(str(data.get('bias_label', '')).strip().lower())
+    if label is None:
+        raise ValueError(f"Unknown bias label: {data.get('bias_label')!r}")
+
+    confidence = data.get('confidence')
+    if isinstance(confidence, str):
+        confidence = _CONFIDENCE_WORDS.get(confidence.strip().lower(), confidence)
+    if isinstance(confidence, bool) or not isinstance(confidence, (int, float)):
+        raise ValueError(f"Invalid confidence: {confidence!r}")
+    confidence = min(1.0, max(0.0, float(confidence)))
+
+    observations = data.get('observations')
+    if not isinstance(observations, list) or not all(isinstance(o, str) for o in observations):
+        raise ValueError("Observations must be a list of strings")
+    observations = [o.strip() for o in observations if o.strip()]
+
+    return {
+        "summary": summary.strip(),
+        "bias": {
+            "label": label,
+            "confidence": confidence,
+            "analysis": "\n".join(f"- {o}" for o in observations)
+        },
+        "observations": observations
+    }
+
+def _is_valid(content):
+    try:
+        parse_combined_analysis(content)
+        return True
+    except ValueError:
+        return False
+
+def _request(client, text, response_format):
+    return cached_completion(
+        client,
+        "combined",
+        text,
+        model=COMBINED_MODEL,
+        system_prompt=COMBINED_SYSTEM_PROMPT,
+        user_prompt=get_combined_analysis_prompt(text),
+        validate=_is_valid,  # malformed replies are retried next time, not cached
+        response_format=response_format,
+        temperature=0.3,
+        max_tokens=900
+    )
+
+def _separate_analysis(text, article_topic):
+    """Fallback: the two single-purpose calls."""
+    bias = detect_bias(text, article_topic)
+    summary = summarize(text)
+    error = None
+    if summary.startswith("Error using OpenAI"):
+        error = summary
+    elif bias.get('label') == "Error":
+        error = bias.get('analysis')
+    return {
+        "summary": summary,
+        "bias": bias,
+        "observations": [],
+        "combined": False,
+        "error": error
+    }
+
+def analyze_article(text, article_topic="General"):
+    """
+    Summarizes and bias-checks an article in a single LLM round-trip.
+
+    Args:
+        text: Cleaned article text
+        article_topic: Article topic (passed on to the bias fallback)
+
+    Returns:
+        dict: summary (str, same as summarize()), bias (dict, same as
+              detect_bias()), observations (list), combined (False when
+              the separate-call fallback was used) and error (None, or the
+              message when the call failed)
+    """
+    if not text or len(text.strip()) < 50:
+        return {
+            "summary": "Text too short to summarize.",
+            "bias": detect_bias(text, article_topic),
+            "observations": [],
+            "combined": False,
+            "error": None
+        }
+
+    client = get_openai_client()
+    if not client:
+        message = "⚠️ OpenRouter API Key missing. Please set OPENROUTER_API_KEY in sidebar."
+        return {
+            "summary": message,
+            "bias": {"label": "Config Error", "confidence": 0.0, "analysis": "OpenRouter Key missing."},
+            "observations": [],
+            "combined": False,
+            "error": message
+        }
+
+    if needs_map_reduce(text):
+        return _separate_analysis(text, article_topic)
+
+    try:
+        try:
+            content = _request(client, text, JSON_SCHEMA_FORMAT)
+        except BadRequestError as e:
+            # Some OpenRouter providers do not support strict structured outputs
+            print(f"⚠️ json_schema output rejected, retrying as json_object: {e}")
+            content = _request(client, text, JSON_OBJECT_FORMAT)
+        return {**parse_combined_analysis(content), "combined": True, "error": None}
+
+    except ValueError as e:
+        # The call worked but the reply is unusable: the single-purpose prompts are more forgiving
+        print(f"⚠️ Combined analysis reply invalid ({e}), falling back to separate calls")
+        return _separate_analysis(text, article_topic)
+
+    except Exception as e:
+        print(f"OpenAI combined analysis error: {e}")
+        return {
+            "summary": f"Error using OpenAI: {str(e)}",
+            "bias": {"label": "Error", "confidence": 0.0, "analysis": f"OpenAI Error: {str(e)}"},
+            "observations": [],
+            "combined": False,
+            "error": str(e)
+        }
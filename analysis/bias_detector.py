@@ -5,24 +5,11 @@ Bias Detector - HYBRID VERSION
 """
 
 import streamlit as st
-import os
 # from transformers import pipeline (Removed)
-from openai import OpenAI
 from utils.prompts import BIAS_SYSTEM_PROMPT, get_bias_prompt
+from utils.llm_client import get_openai_client, cached_completion, CompletionStream
 
-def get_openai_client():
-    """Initialize OpenRouter client"""
-    api_key = os.getenv("OPENROUTER_API_KEY")
-    if not api_key:
-        return None
-    api_key = api_key.strip().strip("'").strip('"')
-    print(f"🔑 Loaded OpenRouter Key (Bias): {api_key[:5]}...")
-    return OpenAI(
-        base_url="https://openrouter.ai/api/v1",
-        api_key=api_key
-    )
-
-
+BIAS_MODEL = "openai/gpt-4o"
 
 
 def detect_bias(text, article_topic="General"):
@@ -40,6 +27,56 @@ def detect_bias(text, article_topic="General"):
     # Unified Path: Use GPT-4o for everything
     return _detect_comprehensive_bias(text)
 
+def detect_bias_stream(text, article_topic="General"):
+    """
+    Streaming variant of detect_bias(): returns an iterable of report text
+    chunks (render with st.write_stream). After iteration, `.result` holds
+    the same dict detect_bias() returns.
+    """
+    if not text or len(text.strip()) < 20:
+        return CompletionStream.static("Text too short for bias analysis.", result={
+            "label": "Insufficient Text",
+            "confidence": 0.0,
+            "analysis": "Text too short for bias analysis."
+        })
+    
+    client = get_openai_client()
+    if not client:
+        return CompletionStream.static("OpenRouter Key missing.", result={
+            "label": "Config Error", "confidence": 0.0, "analysis": "OpenRouter Key missing."
+        }, error="OpenRouter Key missing.")
+    
+    return CompletionStream(
+        client,
+        "bias",
+        text,
+        model=BIAS_MODEL,
+        system_prompt=BIAS_SYSTEM_PROMPT,
+        user_prompt=get_bias_prompt(text),
+        parse=parse_bias_report,
+        on_error=lambda e: {"label": "Error", "confidence": 0.0, "analysis": f"OpenAI Error: {str(e)}"},
+        temperature=0.3, # Low temp for consistency
+        max_tokens=400
+    )
+
+def parse_bias_report(content):
+    """Turns the model's 'Label: ... Analysis: ...' report into a result dict."""
+    # naive parsing
+    label = "Bias Detected"
+    if "Label:" in content:
+        try:
+            # Extract explicitly labeled bias
+            label_line = [line for line in content.split('\n') if 'Label:' in line][0]
+            label = label_line.split("Label:")[1].strip()
+        except:
+            pass
+    
+    return {
+        "label": label,
+        "confidence": 0.95, # OpenAI is generally high confidence
+        "analysis": content.replace("Label:", "").replace("Analysis:", "").strip()
+    }
+
 # Removed _detect_political_bias (legacy local model)
 
 def _detect_comprehensive_bias(text):
@@ -50,37 +87,19 @@ def _detect_comprehensive_bias(text):
         
     try:
         # OpenRouter Prompt for detailed bias check
-        response = client.chat.completions.create(
-            model="openai/gpt-4o",
-            messages=[
-                {"role": "system", "content": BIAS_SYSTEM_PROMPT},
-                {"role": "user", "content": get_bias_prompt(text)}
-            ],
+        # Raw report is cached; parsing below is re-applied on a cache hit
+        content = cached_completion(
+            client,
+            "bias",
+            text,
+            model=BIAS_MODEL,
+            system_prompt=BIAS_SYSTEM_PROMPT,
+            user_prompt=get_bias_prompt(text),
             temperature=0.3, # Low temp for consistency
-            max_tokens=400,
-            extra_headers={
-                "HTTP-Referer": "http://localhost:8501", 
-                "X-Title": "News Intelligence App",
-            }
+            max_tokens=400
         )
         
-        content = response.choices[0].message.content.strip()
-        
-        # naive parsing
-        label = "Bias Detected"
-        if "Label:" in content:
-            try:
-                # Extract explicitly labeled bias
-                label_line = [line for line in content.split('\n') if 'Label:' in line][0]
-                label = label_line.split("Label:")[1].strip()
-            except:
-                pass
-        
-        return {
-            "label": label,
-            "confidence": 0.95, # OpenAI is generally high confidence
-            "analysis": content.replace("Label:", "").replace("Analysis:", "").strip()
-        }
+        return parse_bias_report(content)
 
     except Exception as e:
         return {
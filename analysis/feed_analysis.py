@@ -0,0 +1,105 @@
+"""
+Bulk Feed Analysis
+Runs summarize / detect_bias over a whole feed on a bounded thread pool
+(articles needing both get one combined call, see analysis.article_analyzer).
+Results are yielded as each (article, task) pair completes, so callers can
+show progress and persist partial results; one failed article never stops
+the batch. OpenRouter request rate is bounded by the shared token bucket in
+utils.llm_client.
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from analysis.article_analyzer import analyze_article
+from analysis.bias_detector import detect_bias
+from generation.summarizer import summarize
+from preprocessing.text_cleaner import clean_text
+
+MAX_WORKERS = int(os.getenv('BULK_ANALYSIS_WORKERS', 4))
+
+TASKS = ('summary', 'bias')
+
+def _is_failure(task, result):
+    """summarize / detect_bias report errors in-band instead of raising."""
+    if task == 'summary':
+        return not result or result.startswith(("Error using OpenAI", "⚠️", "Text too short"))
+    return result.get('label') in ("Error", "Config Error", "Insufficient Text")
+
+def _run_task(article, task):
+    text = clean_text(article.get('content') or article.get('description') or '')
+    if task == 'summary':
+        return summarize(text)
+    return detect_bias(text, article.get('topic', 'General'))
+
+def _run_combined(article):
+    """Both tasks from one structured call (analyze_article)."""
+    text = clean_text(article.get('content') or article.get('description') or '')
+    result = analyze_article(text, article.get('topic', 'General'))
+    return {'summary': result['summary'], 'bias': result['bias']}
+
+def analyze_feed(articles, tasks=TASKS, max_workers=MAX_WORKERS, skip_done=True, combined=True):
+    """
+    Analyzes every article of a feed concurrently.
+
+    Args:
+        articles: Article dicts (with 'id', 'content' / 'description', 'topic')
+        tasks: Any of 'summary', 'bias'
+        max_workers: Concurrent LLM calls
+        skip_done: Skip tasks whose result is already on the article
+        combined: Articles needing both tasks get a single combined LLM call
+
+    Yields:
+        dict: article_id, task, ok, result (None on failure), error, elapsed_ms,
+              done and total (progress counters)
+    """
+    jobs = []
+    for article in articles:
+        pending = tuple(task for task in tasks if not (skip_done and article.get(task)))
+        if combined and set(pending) == set(TASKS):
+            jobs.append((article, pending))
+        else:
+            jobs.extend((article, (task,)) for task in pending)
+    total = sum(len(pending) for _, pending in jobs)
+    if not total:
+        return
+
+    def item(article, task, result, error, start):
+        return {
+            "article_id": article['id'],
+            "task": task,
+            "ok": error is None,
+            "result": result if error is None else None,
+            "error": None if error is None else (error if isinstance(error, str) else error.get('analysis')),
+            "elapsed_ms": (time.perf_counter() - start) * 1000
+        }
+
+    def run(article, pending):
+        start = time.perf_counter()
+        try:
+            if len(pending) > 1:
+                results = _run_combined(article)
+            else:
+                results = {pending[0]: _run_task(article, pending[0])}
+        except Exception as e:  # isolate: report and keep going
+            return [item(article, task, None, str(e), start) for task in pending]
+        return [
+            item(article, task, results[task], results[task] if _is_failure(task, results[task]) else None, start)
+            for task in pending
+        ]
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='feed-analysis')
+    try:
+        futures = [executor.submit(run, article, pending) for article, pending in jobs]
+        done = 0
+        for future in as_completed(futures):
+            for result in future.result():
+                done += 1
+                yield {**result, "done": done, "total": total}
+    finally:
+        # If the consumer stops early (e.g. a Streamlit rerun), drop queued jobs
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -1,23 +1,93 @@
 """
 Sentiment Analyzer
-Analyzes sentiment of news articles using transformers.
-Uses @st.cache_resource to avoid re-downloading models.
+Analyzes sentiment of news articles using NLTK VADER.
+Uses @st.cache_resource and a precompiled lexicon so nothing is loaded or downloaded at import time.
 """
 
 import streamlit as st
-import nltk
-from nltk.sentiment import SentimentIntensityAnalyzer
+import os
+import sys
+import re
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
-# Download VADER lexicon if not present
-try:
-    nltk.data.find('sentiment/vader_lexicon.zip')
-except LookupError:
-    nltk.download('vader_lexicon')
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.cache import TTLCache
+from analysis.vader_lexicon import load_lexicon
+from preprocessing.text_cleaner import clean_text
+
+# Process-wide memo of scored texts, shared by every session
+MEMO_MAX_ENTRIES = int(os.getenv('SENTIMENT_CACHE_SIZE', 20000))
+MEMO_PATH = os.getenv('SENTIMENT_CACHE_PATH') or None
+
+_sentiment_memo = TTLCache(max_entries=MEMO_MAX_ENTRIES, path=MEMO_PATH)
+
+def build_analyzer():
+    """
+    VADER analyzer backed by the compiled lexicon. NLTK is imported here, on
+    first use, and its lexicon file is never read or downloaded.
+    """
+    from nltk.sentiment.vader import SentimentIntensityAnalyzer, VaderConstants
+
+    sia = SentimentIntensityAnalyzer.__new__(SentimentIntensityAnalyzer)
+    sia.lexicon = load_lexicon()
+    sia.constants = VaderConstants()
+    return sia
 
 @st.cache_resource
 def load_sentiment_model():
     """Load VADER sentiment analyzer"""
-    return SentimentIntensityAnalyzer()
+    return build_analyzer()
+
+def label_from_compound(compound):
+    """Maps a VADER compound score (-1 to 1) to our label/score format"""
+    if compound >= 0.05:
+        label = "POSITIVE"
+        score = compound
+    elif compound <= -0.05:
+        label = "NEGATIVE"
+        score = abs(compound)
+    else:
+        label = "NEUTRAL"
+        score = 1.0 - abs(compound) # High confidence in neutrality
+        
+    return {
+        "label": label,
+        "score": float(score)
+    }
+
+def _analyze_with(sia, text):
+    """Scores one text with an already loaded analyzer"""
+    if not text or len(text.strip()) < 5:
+        return {"label": "NEUTRAL", "score": 0.0}
+    
+    try:
+        return label_from_compound(sia.polarity_scores(text)['compound'])
+    except Exception as e:
+        print(f"Sentiment analysis error: {e}")
+        return {"label": "ERROR", "score": 0.0}
+
+# ----------------- MEMO CACHE -----------------
+def _memo_key(text):
+    """
+    Hash of the whitespace-normalized text. Case and punctuation are kept:
+    VADER scores "GREAT!!" higher than "great".
+    """
+    normalized = ' '.join(text.split())
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+def _remember(key, result):
+    if result['label'] != 'ERROR':
+        _sentiment_memo.set(key, result)
+
+def get_sentiment_cache_stats():
+    """Returns hit/miss counters of the sentiment memo cache."""
+    return _sentiment_memo.stats()
+
+def clear_sentiment_cache():
+    """Empties the sentiment memo cache."""
+    _sentiment_memo.clear()
 
 def analyze_sentiment(text):
     """
@@ -26,28 +96,182 @@ def analyze_sentiment(text):
     """
     if not text or len(text.strip()) < 5:
         return {"label": "NEUTRAL", "score": 0.0}
-    
+
+    key = _memo_key(text)
+    cached = _sentiment_memo.get(key)
+    if cached is not None:
+        return dict(cached)
+
     try:
         sia = load_sentiment_model()
-        scores = sia.polarity_scores(text)
-        compound = scores['compound']
-        
-        # Map compound score (-1 to 1) to labels
-        if compound >= 0.05:
-            label = "POSITIVE"
-            score = compound
-        elif compound <= -0.05:
-            label = "NEGATIVE"
-            score = abs(compound)
-        else:
-            label = "NEUTRAL"
-            score = 1.0 - abs(compound) # High confidence in neutrality
-            
-        return {
-            "label": label,
-            "score": float(score)
-        }
-    
     except Exception as e:
         print(f"Sentiment analysis error: {e}")
         return {"label": "ERROR", "score": 0.0}
+    result = _analyze_with(sia, text)
+    _remember(key, result)
+    return dict(result)
+
+# ----------------- SEGMENTED (LONG ARTICLES) -----------------
+_PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+(?=["\'(]?[A-Z0-9])')
+
+def split_segments(text, mode='auto', min_paragraphs=3):
+    """
+    Splits raw article text into paragraphs or sentences.
+
+    Args:
+        text: Article body (paragraphs separated by blank lines, as scraped)
+        mode: 'paragraph', 'sentence', or 'auto' (paragraphs when the text has
+              at least `min_paragraphs` of them, sentences otherwise)
+
+    Returns:
+        list: Non-empty segments
+    """
+    paragraphs = [p.strip() for p in _PARAGRAPH_BREAK.split(text or '') if p.strip()]
+    if mode == 'paragraph' or (mode == 'auto' and len(paragraphs) >= min_paragraphs):
+        return paragraphs
+    return [s for p in paragraphs for s in _SENTENCE_END.split(' '.join(p.split())) if s]
+
+def iter_segment_sentiment(segments):
+    """
+    Scores segments one at a time, so callers can stop early.
+
+    Yields:
+        dict: index, chars, compound, label, score for each segment
+    """
+    sia = load_sentiment_model()
+    for index, segment in enumerate(segments):
+        segment = clean_text(segment)
+        compound = sia.polarity_scores(segment)['compound'] if len(segment) >= 5 else 0.0
+        yield {"index": index, "chars": len(segment), "compound": compound, **label_from_compound(compound)}
+
+def analyze_sentiment_segments(text, mode='auto', early_exit=None, min_segments=5):
+    """
+    Paragraph/sentence-level sentiment for long articles.
+
+    Args:
+        text: Raw article body (not yet cleaned, so paragraph breaks survive)
+        mode: See split_segments
+        early_exit: Stop once the running |compound| reaches this value
+                    (after at least `min_segments`); None scores everything
+        min_segments: Segments to score before early exit is considered
+
+    Returns:
+        dict: label/score like analyze_sentiment (from the length-weighted
+              mean compound) plus 'compound', the per-segment 'curve', and
+              'segments_scored' / 'segments_total'
+    """
+    segments = split_segments(text, mode)
+    if not segments:
+        return {"label": "NEUTRAL", "score": 0.0, "compound": 0.0, "curve": [],
+                "segments_scored": 0, "segments_total": 0}
+
+    try:
+        curve = []
+        weighted, total_chars = 0.0, 0
+        for result in iter_segment_sentiment(segments):
+            curve.append(result)
+            weighted += result['compound'] * result['chars']
+            total_chars += result['chars']
+            running = weighted / total_chars if total_chars else 0.0
+            if early_exit is not None and len(curve) >= min_segments and abs(running) >= early_exit:
+                break
+    except Exception as e:
+        print(f"Sentiment analysis error: {e}")
+        return {"label": "ERROR", "score": 0.0}
+
+    compound = round(weighted / total_chars, 4) if total_chars else 0.0
+    return {
+        **label_from_compound(compound),
+        "compound": compound,
+        "curve": [{k: r[k] for k in ('index', 'chars', 'compound', 'label')} for r in curve],
+        "segments_scored": len(curve),
+        "segments_total": len(segments)
+    }
+
+# ----------------- BATCH / PROCESS POOL -----------------
+_worker_sia = None
+
+def _init_worker():
+    """Process pool initializer: load VADER once per worker"""
+    global _worker_sia
+    _worker_sia = build_analyzer()
+
+def _analyze_chunk(texts):
+    return [_analyze_with(_worker_sia, text) for text in texts]
+
+def analyze_sentiment_batch(texts, chunk_size=500, max_workers=None, parallel_threshold=2000, engine='nltk'):
+    """
+    Scores many texts, yielding results in input order as they complete.
+
+    Texts already in the memo cache are answered from it. The rest are scored
+    in-process for small batches, or split into chunks and spread over a
+    process pool (VADER is pure Python, so threads don't help). The
+    'vectorized' engine scores them all in one NumPy pass instead.
+
+    Args:
+        texts: Iterable of texts (e.g. full article bodies)
+        chunk_size: Texts per worker task
+        max_workers: Pool size (default: CPU count)
+        parallel_threshold: Minimum batch size worth starting a pool for
+        engine: 'nltk' (VADER per text) or 'vectorized' (NumPy VADER port)
+
+    Yields:
+        dict: Same format as analyze_sentiment
+    """
+    texts = list(texts)
+    keys = [_memo_key(text) if text and len(text.strip()) >= 5 else None for text in texts]
+    cached = [_sentiment_memo.get(key) if key else None for key in keys]
+    misses = [text for key, hit, text in zip(keys, cached, texts) if key and hit is None]
+
+    if engine == 'vectorized':
+        scored = _score_vectorized(misses)
+    else:
+        scored = _score_uncached(misses, chunk_size, max_workers, parallel_threshold)
+    for key, hit in zip(keys, cached):
+        if key is None:
+            yield {"label": "NEUTRAL", "score": 0.0}
+        elif hit is not None:
+            yield dict(hit)
+        else:
+            result = next(scored)
+            _remember(key, result)
+            yield dict(result)
+
+def _score_vectorized(texts):
+    """Scores texts with the vectorized VADER port (same label mapping)."""
+    try:
+        from analysis.vectorized_vader import get_vectorized_vader  # NumPy: import on first use
+        compounds = get_vectorized_vader().compound_scores(texts)
+    except Exception as e:
+        print(f"Sentiment analysis error: {e}")
+        for _ in texts:
+            yield {"label": "ERROR", "score": 0.0}
+        return
+    for compound in compounds:
+        yield label_from_compound(float(compound))
+
+def _score_uncached(texts, chunk_size, max_workers, parallel_threshold):
+    """Scores texts without consulting the memo (in-process or process pool)."""
+    max_workers = max_workers or os.cpu_count() or 1
+    if len(texts) < parallel_threshold or max_workers <= 1:
+        try:
+            sia = load_sentiment_model()
+        except Exception as e:
+            print(f"Sentiment analysis error: {e}")
+            for _ in texts:
+                yield {"label": "ERROR", "score": 0.0}
+            return
+        for text in texts:
+            yield _analyze_with(sia, text)
+        return
+
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    # 'spawn' avoids forking the multi-threaded Streamlit server process
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker
+    ) as executor:
+        for results in executor.map(_analyze_chunk, chunks):
+            yield from results
@@ -0,0 +1,90 @@
+"""
+VADER Lexicon Loader
+Compiles NLTK's vader_lexicon.txt into a pickled {token: valence} dict once,
+so the sentiment analyzer starts in milliseconds without touching nltk_data
+or the network. The compiled lexicon is committed next to this module
+(analysis/vader_lexicon.pkl); the runtime never downloads anything.
+
+Usage:
+    python -m analysis.vader_lexicon    # (re)build the compiled lexicon (downloads it if needed)
+"""
+
+import os
+import pickle
+import sys
+import threading
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+LEXICON_PATH = os.getenv('VADER_LEXICON_PATH', os.path.join(PROJECT_ROOT, 'analysis', 'vader_lexicon.pkl'))
+NLTK_LEXICON_RESOURCE = "sentiment/vader_lexicon.zip/vader_lexicon/vader_lexicon.txt"
+
+_lexicon = None
+_lexicon_lock = threading.Lock()
+
+def parse_lexicon(raw):
+    """Parses vader_lexicon.txt content (same rules as NLTK's make_lex_dict)."""
+    lexicon = {}
+    for line in raw.split("\n"):
+        word, measure = line.strip().split("\t")[0:2]
+        lexicon[word] = float(measure)
+    return lexicon
+
+def compile_lexicon(path=LEXICON_PATH, download=True):
+    """
+    Reads the lexicon from nltk_data (downloading it if allowed) and writes
+    the compiled pickle.
+
+    Returns:
+        dict: token -> valence
+    """
+    import nltk
+
+    try:
+        raw = nltk.data.load(NLTK_LEXICON_RESOURCE)
+    except LookupError:
+        if not download:
+            raise
+        print("📥 Downloading VADER lexicon...")
+        nltk.download('vader_lexicon', quiet=True)
+        raw = nltk.data.load(NLTK_LEXICON_RESOURCE)
+
+    lexicon = parse_lexicon(raw)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(lexicon, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return lexicon
+
+def load_lexicon(path=LEXICON_PATH):
+    """
+    Returns the VADER lexicon, loading the compiled pickle on first use. If
+    it is missing, it is compiled from a local nltk_data copy; nothing is
+    downloaded at runtime.
+
+    Raises:
+        RuntimeError: If neither the compiled lexicon nor nltk_data has it
+    """
+    global _lexicon
+    with _lexicon_lock:
+        if _lexicon is None:
+            try:
+                with open(path, 'rb') as f:
+                    _lexicon = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                try:
+                    _lexicon = compile_lexicon(path, download=False)
+                except LookupError:
+                    raise RuntimeError(
+                        f"VADER lexicon not found at {path}. "
+                        "Run `python -m analysis.vader_lexicon` once to build it."
+                    ) from None
+        return _lexicon
+
+def main():
+    lexicon = compile_lexicon()
+    print(f"✅ Compiled {len(lexicon)} VADER entries to {LEXICON_PATH}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,316 @@
+"""
+Vectorized VADER Scorer
+NumPy port of NLTK's VADER compound score for scoring large batches of
+headlines. Texts are tokenized once, mapped to an integer vocabulary, and
+the lexicon / booster / negation / caps / "but" / punctuation rules run as
+array operations over every token of the batch at once.
+
+Tracks nltk.sentiment.vader rule for rule (including its use of a token's
+first occurrence when it repeats), so compound scores match NLTK's to
+within float summation error.
+"""
+
+import os
+import re
+import string
+import sys
+import threading
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from analysis.vader_lexicon import load_lexicon
+
+# VADER constants (nltk.sentiment.vader.VaderConstants)
+B_INCR = 0.293
+B_DECR = -0.293
+C_INCR = 0.733
+N_SCALAR = -0.74
+NORMALIZE_ALPHA = 15
+
+NEGATE = {
+    "aint", "arent", "cannot", "cant", "couldnt", "darent", "didnt", "doesnt",
+    "ain't", "aren't", "can't", "couldn't", "daren't", "didn't", "doesn't",
+    "dont", "hadnt", "hasnt", "havent", "isnt", "mightnt", "mustnt", "neither",
+    "don't", "hadn't", "hasn't", "haven't", "isn't", "mightn't", "mustn't",
+    "neednt", "needn't", "never", "none", "nope", "nor", "not", "nothing",
+    "nowhere", "oughtnt", "shant", "shouldnt", "uhuh", "wasnt", "werent",
+    "oughtn't", "shan't", "shouldn't", "uh-uh", "wasn't", "weren't", "without",
+    "wont", "wouldnt", "won't", "wouldn't", "rarely", "seldom", "despite",
+}
+
+BOOSTERS = {
+    **dict.fromkeys([
+        "absolutely", "amazingly", "awfully", "completely", "considerably",
+        "decidedly", "deeply", "effing", "enormously", "entirely", "especially",
+        "exceptionally", "extremely", "fabulously", "flipping", "flippin",
+        "fricking", "frickin", "frigging", "friggin", "fully", "fucking",
+        "greatly", "hella", "highly", "hugely", "incredibly", "intensely",
+        "majorly", "more", "most", "particularly", "purely", "quite", "really",
+        "remarkably", "so", "substantially", "thoroughly", "totally",
+        "tremendously", "uber", "unbelievably", "unusually", "utterly", "very",
+    ], B_INCR),
+    **dict.fromkeys([
+        "almost", "barely", "hardly", "kinda", "kindof", "kind-of", "less",
+        "little", "marginally", "occasionally", "partly", "scarcely", "slightly",
+        "somewhat", "sorta", "sortof", "sort-of",
+    ], B_DECR),
+}
+
+# Two-word dampeners ("kind of") and idioms are matched on the raw tokens
+BOOSTER_BIGRAMS = [("just", "enough"), ("kind", "of"), ("sort", "of")]
+IDIOM_BIGRAMS = {("the", "shit"): 3, ("the", "bomb"): 3, ("bad", "ass"): 1.5, ("yeah", "right"): -2}
+IDIOM_TRIGRAMS = {("cut", "the", "mustard"): 2, ("kiss", "of", "death"): -1.5, ("hand", "to", "mouth"): -2}
+
+PUNCTUATION = string.punctuation
+PUNC_LIST = {".", "!", "?", ",", ";", ":", "-", "'", '"', "!!", "!!!", "??", "???", "?!?", "!?!", "?!?!", "!?!?"}
+_REMOVE_PUNCTUATION = re.compile(f"[{re.escape(PUNCTUATION)}]")
+
+
+def _tokenize(text):
+    """
+    VADER's words_and_emoticons: whitespace tokens longer than one character,
+    with one leading or trailing PUNC_LIST mark stripped from plain words.
+    """
+    words_only = {w for w in _REMOVE_PUNCTUATION.sub("", text).split() if len(w) > 1}
+    tokens = []
+    for token in text.split():
+        if len(token) < 2:
+            continue
+        core = token.rstrip(PUNCTUATION)
+        if core != token:
+            if token[len(core):] in PUNC_LIST and core in words_only:
+                token = core
+        else:
+            core = token.lstrip(PUNCTUATION)
+            if core != token and token[:len(token) - len(core)] in PUNC_LIST and core in words_only:
+                token = core
+        tokens.append(token)
+    return tokens
+
+
+def _shift(values, k, fill):
+    """values[i - k] at position i (fill for the first k positions)."""
+    if k == 0:
+        return values
+    shifted = np.empty_like(values)
+    shifted[:k] = fill
+    shifted[k:] = values[:-k]
+    return shifted
+
+
+def _ahead(values, k, fill):
+    """values[i + k] at position i (fill for the last k positions)."""
+    shifted = np.empty_like(values)
+    shifted[-k:] = fill
+    shifted[:-k] = values[k:]
+    return shifted
+
+
+class VectorizedVader:
+    """
+    Batch VADER compound scorer backed by integer vocabulary arrays.
+
+    Args:
+        lexicon: {token: valence} dict (default: the compiled VADER lexicon)
+    """
+
+    def __init__(self, lexicon=None):
+        lexicon = load_lexicon() if lexicon is None else lexicon
+
+        words = set(lexicon) | set(BOOSTERS) | NEGATE | {"least", "at", "very", "but", "kind", "of"}
+        self.vocab = {word: i for i, word in enumerate(sorted(words), start=2)}
+        size = len(self.vocab) + 2
+        # id 0: unknown token, id 1: unknown token containing "n't" (still a negation)
+        self.valence = np.zeros(size)
+        self.in_lexicon = np.zeros(size, dtype=bool)
+        self.booster = np.zeros(size)
+        self.negation = np.zeros(size, dtype=bool)
+        self.negation[1] = True
+        for word, i in self.vocab.items():
+            if word in lexicon:
+                self.valence[i] = lexicon[word]
+                self.in_lexicon[i] = True
+            self.booster[i] = BOOSTERS.get(word, 0.0)
+            self.negation[i] = word in NEGATE or "n't" in word
+        self.is_booster = self.booster != 0
+        self.least_id = self.vocab["least"]
+        self.at_id = self.vocab["at"]
+        self.very_id = self.vocab["very"]
+        self.but_id = self.vocab["but"]
+        self.kind_id = self.vocab["kind"]
+        self.of_id = self.vocab["of"]
+
+        # Case-sensitive codes for the rules NLTK applies to raw tokens
+        exact_words = {"never", "so", "this"}
+        for gram in BOOSTER_BIGRAMS + list(IDIOM_BIGRAMS) + list(IDIOM_TRIGRAMS):
+            exact_words.update(gram)
+        self.exact = {word: i for i, word in enumerate(sorted(exact_words), start=1)}
+
+    def _encode(self, texts):
+        """Flattens a batch into per-token arrays."""
+        vocab_get = self.vocab.get
+        exact_get = self.exact.get
+        ids, exact, upper, doc, pos, first = [], [], [], [], [], []
+        n_tokens = np.zeros(len(texts), dtype=np.int64)
+        cap_diff = np.zeros(len(texts), dtype=bool)
+
+        for d, text in enumerate(texts):
+            tokens = _tokenize(text if isinstance(text, str) else str(text))
+            offset = len(ids)
+            seen = {}
+            n_upper = 0
+            for p, token in enumerate(tokens):
+                lower = token.lower()
+                token_id = vocab_get(lower, 0)
+                if not token_id and "n't" in lower:
+                    token_id = 1
+                is_upper = token.isupper()
+                n_upper += is_upper
+                ids.append(token_id)
+                exact.append(exact_get(token, 0))
+                upper.append(is_upper)
+                first.append(seen.setdefault(token, offset + p))
+            n_tokens[d] = len(tokens)
+            cap_diff[d] = 0 < len(tokens) - n_upper < len(tokens)
+            doc.extend([d] * len(tokens))
+            pos.extend(range(len(tokens)))
+
+        return (np.asarray(ids, dtype=np.int64), np.asarray(exact, dtype=np.int64),
+                np.asarray(upper, dtype=bool), np.asarray(doc, dtype=np.int64),
+                np.asarray(pos, dtype=np.int64), np.asarray(first, dtype=np.int64),
+                cap_diff)
+
+    def _ngram_values(self, exact, doc, grams):
+        """Idiom value of the raw n-gram starting at each position (NaN if none)."""
+        values = np.full(len(exact), np.nan)
+        for gram, value in grams.items():
+            match = exact == self.exact[gram[0]]
+            for k, word in enumerate(gram[1:], start=1):
+                match &= (_ahead(exact, k, 0) == self.exact[word]) & (_ahead(doc, k, -1) == doc)
+            values[match] = value
+        return values
+
+    def _valences(self, ids, exact, upper, doc, pos, cap_diff):
+        """Per-token valence, as NLTK's sentiment_valence computes it."""
+        in_lex = self.in_lexicon[ids]
+        negated = self.negation[ids]
+        booster = self.booster[ids]
+        caps = upper & cap_diff[doc]
+        so_this = (exact == self.exact["so"]) | (exact == self.exact["this"])
+        never = exact == self.exact["never"]
+
+        v = self.valence[ids].copy()
+        v = np.where(in_lex & caps, np.where(v > 0, v + C_INCR, v - C_INCR), v)
+
+        for start_i, damp in ((0, 1.0), (1, 0.95), (2, 0.9)):
+            k = start_i + 1
+            active = in_lex & (pos > start_i) & ~_shift(in_lex, k, True)
+
+            # Booster / dampener k words back, signed by the current valence
+            s = _shift(booster, k, 0.0)
+            s = np.where(v < 0, -s, s)
+            s = np.where((s != 0) & _shift(caps, k, False), np.where(v > 0, s + C_INCR, s - C_INCR), s)
+            v = np.where(active, v + s * damp, v)
+
+            # Negation ("never so" / "never this" intensify instead)
+            neg_k = _shift(negated, k, False)
+            if start_i == 0:
+                factor = np.where(neg_k, N_SCALAR, 1.0)
+            elif start_i == 1:
+                never_so = _shift(never, 2, False) & _shift(so_this, 1, False)
+                factor = np.where(never_so, 1.5, np.where(neg_k, N_SCALAR, 1.0))
+            else:
+                never_so = (_shift(never, 3, False) & _shift(so_this, 2, False)) | _shift(so_this, 1, False)
+                factor = np.where(never_so, 1.25, np.where(neg_k, N_SCALAR, 1.0))
+            v = np.where(active, v * factor, v)
+
+            if start_i == 2:
+                v = np.where(active, self._idioms(v, exact, doc), v)
+
+        # "least" negates unless preceded by "at least" / "very least"
+        prev_least = in_lex & (pos > 0) & (_shift(ids, 1, 0) == self.least_id)
+        prev2 = _shift(ids, 2, 0)
+        least_neg = prev_least & ((pos == 1) | ((prev2 != self.at_id) & (prev2 != self.very_id)))
+        v = np.where(least_neg, v * N_SCALAR, v)
+
+        # Non-lexicon words, boosters and "kind of" contribute nothing
+        kind_of = (ids == self.kind_id) & (_ahead(ids, 1, 0) == self.of_id) & (_ahead(doc, 1, -1) == doc)
+        return np.where(in_lex & ~self.is_booster[ids] & ~kind_of, v, 0.0)
+
+    def _idioms(self, v, exact, doc):
+        """NLTK's _idioms_check for a lexicon word at every position (i > 2)."""
+        bigram = self._ngram_values(exact, doc, IDIOM_BIGRAMS)
+        trigram = self._ngram_values(exact, doc, IDIOM_TRIGRAMS)
+
+        # First match among: (i-1, i), (i-2..i), (i-2, i-1), (i-3..i-1), (i-3, i-2)
+        idiom = np.full(len(v), np.nan)
+        for candidate in reversed((_shift(bigram, 1, np.nan), _shift(trigram, 2, np.nan),
+                                   _shift(bigram, 2, np.nan), _shift(trigram, 3, np.nan),
+                                   _shift(bigram, 3, np.nan))):
+            idiom = np.where(np.isnan(candidate), idiom, candidate)
+        # ...overridden by idioms starting at the word itself
+        idiom = np.where(np.isnan(bigram), idiom, bigram)
+        idiom = np.where(np.isnan(trigram), idiom, trigram)
+        v = np.where(np.isnan(idiom), v, idiom)
+
+        # "kind of" / "sort of" / "just enough" two or three words back dampen
+        booster_bigram = np.zeros(len(v), dtype=bool)
+        for first_word, second_word in BOOSTER_BIGRAMS:
+            booster_bigram |= ((exact == self.exact[first_word])
+                               & (_ahead(exact, 1, 0) == self.exact[second_word]))
+        dampen = _shift(booster_bigram, 2, False) | _shift(booster_bigram, 3, False)
+        return np.where(dampen, v + B_DECR, v)
+
+    def compound_scores(self, texts):
+        """
+        VADER compound score for every text.
+
+        Args:
+            texts: Sequence of strings
+
+        Returns:
+            np.ndarray: Compound scores in [-1, 1], rounded to 4 places like NLTK
+        """
+        texts = list(texts)
+        if not texts:
+            return np.zeros(0)
+        ids, exact, upper, doc, pos, first, cap_diff = self._encode(texts)
+
+        sentiments = np.zeros(0)
+        if len(ids):
+            # Repeated tokens are scored at their first position (as in NLTK)
+            sentiments = self._valences(ids, exact, upper, doc, pos, cap_diff)[first]
+
+            # "but": halve everything before the first one, boost everything after
+            but_pos = np.full(len(texts), np.iinfo(np.int64).max)
+            is_but = ids == self.but_id
+            np.minimum.at(but_pos, doc[is_but], pos[is_but])
+            doc_but = but_pos[doc]
+            has_but = doc_but != np.iinfo(np.int64).max
+            sentiments = np.where(has_but & (pos < doc_but), sentiments * 0.5,
+                                  np.where(has_but & (pos > doc_but), sentiments * 1.5, sentiments))
+
+        total = np.bincount(doc, weights=sentiments, minlength=len(texts)) if len(ids) else np.zeros(len(texts))
+
+        # Emphasis from "!" (up to 4) and "??" / "???" (capped at 0.96)
+        exclaims = np.array([min(text.count("!"), 4) for text in map(str, texts)]) * 0.292
+        questions = np.array([text.count("?") for text in map(str, texts)])
+        questions = np.where(questions > 3, 0.96, np.where(questions > 1, questions * 0.18, 0.0))
+        emphasis = exclaims + questions
+        total = np.where(total > 0, total + emphasis, np.where(total < 0, total - emphasis, total))
+
+        compound = total / np.sqrt(total * total + NORMALIZE_ALPHA)
+        return np.round(compound, 4)
+
+
+_scorer = None
+_scorer_lock = threading.Lock()
+
+def get_vectorized_vader():
+    """Process-wide scorer (vocabulary arrays are built once)."""
+    global _scorer
+    with _scorer_lock:
+        if _scorer is None:
+            _scorer = VectorizedVader()
+        return _scorer
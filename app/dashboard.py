@@ -1,11 +1,12 @@
 import streamlit as st
 import sys
 import os
+import time
 from dotenv import load_dotenv
 from streamlit_autorefresh import st_autorefresh
-from newspaper import Article as NewsArticle
 import pandas as pd
 from collections import Counter
+from itertools import islice
 
 # Load environment variables from project root
 env_path = os.path.join(os.path.dirname(__file__), '..', '.env')
@@ -15,11 +16,20 @@ load_dotenv(dotenv_path=env_path)
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from classification.topic_classifier import classify_topic
-from analysis.sentiment_analyzer import analyze_sentiment
-from analysis.bias_detector import detect_bias
-from generation.summarizer import summarize
+from analysis.sentiment_analyzer import analyze_sentiment_segments
+from analysis.feed_analysis import analyze_feed
+from analysis.bias_detector import detect_bias_stream
+from analysis.article_analyzer import analyze_article
+from generation.summarizer import summarize_stream, count_sections
 from preprocessing.text_cleaner import clean_text
-from preprocessing.ingestion.news_fetcher import fetch_news, fetch_default_news, search_news_by_query
+from preprocessing.ingestion.news_fetcher import fetch_default_news, iter_news, get_cache_stats
+from preprocessing.ingestion.fulltext import get_prefetcher, get_cached_full_text, needs_full_text
+from utils.llm_client import get_llm_latency_stats
+from storage.llm_cache import get_llm_cache_stats
+from storage.article_repository import (
+    DEFAULT_FEED, LIVE_FEED, upsert_articles, update_analysis, query_articles,
+    count_articles, count_by, feed_updated_at
+)
 # Page Config
 # Page Config handled by router
 
@@ -243,8 +253,11 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Initialize session state
-if 'articles' not in st.session_state:
-    st.session_state.articles = []
+# Articles live in the shared article repository; the session only tracks which feed it shows
+if 'feed_name' not in st.session_state:
+    st.session_state.feed_name = None
+if 'feed_order' not in st.session_state:
+    st.session_state.feed_order = 'recent'  # 'recent' (default / live feed) or 'rank' (search relevancy)
 if 'newsapi_key' not in st.session_state:
     st.session_state.newsapi_key = os.getenv('NEWSAPI_KEY', '')
 if 'auto_loaded' not in st.session_state:
@@ -255,6 +268,8 @@ if 'selected_article' not in st.session_state:
     st.session_state.selected_article = None
 if 'num_articles' not in st.session_state:
     st.session_state.num_articles = 50
+if 'feed_iter' not in st.session_state:
+    st.session_state.feed_iter = None  # Lazy page walker for "Load more"
 
 # Sidebar
 with st.sidebar:
@@ -310,9 +325,50 @@ with st.sidebar:
         help="How many articles to fetch per search"
     )
     
-    if st.session_state.articles:
+    if st.session_state.feed_name:
         st.markdown("---")
-        st.metric("Total Articles", len(st.session_state.articles))
+        st.metric("Total Articles", count_articles(feed=st.session_state.feed_name))
+        
+        # Bulk AI analysis: summaries + bias for the whole feed, saved as each one finishes
+        if st.button("🧠 Analyze whole feed", width='stretch', help="Summarize and bias-check every article in this feed"):
+            feed_articles = query_articles(feed=st.session_state.feed_name, require_text=True, limit=50)
+            progress = st.progress(0.0, text="Starting analysis...")
+            failures = []
+            for item in analyze_feed(feed_articles):
+                if item['ok']:
+                    update_analysis(item['article_id'], **{item['task']: item['result']})
+                else:
+                    failures.append(item)
+                progress.progress(
+                    item['done'] / item['total'],
+                    text=f"Analyzed {item['done']}/{item['total']} ({len(failures)} failed)"
+                )
+            if failures:
+                st.warning(f"⚠️ {len(failures)} analyses failed (e.g. {failures[0]['error']})")
+            else:
+                st.success("✅ Feed analyzed")
+
+    cache_stats = get_cache_stats()
+    if cache_stats['hits'] or cache_stats['misses']:
+        st.caption(
+            f"🗄️ NewsAPI cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+            f"({cache_stats['hit_rate']:.0%} of requests saved)"
+        )
+
+    llm_stats = get_llm_latency_stats()
+    if llm_stats['count']:
+        st.caption(
+            f"🤖 OpenRouter: {llm_stats['count']} calls, p50 {llm_stats['p50_ms']:.0f} ms, "
+            f"first token p50 {llm_stats['ttft_p50_ms']:.0f} ms "
+            f"(first call on a new connection {llm_stats['cold_call_ms']:.0f} ms)"
+        )
+
+    llm_cache_stats = get_llm_cache_stats()
+    if llm_cache_stats['hits'] or llm_cache_stats['misses']:
+        st.caption(
+            f"🧠 AI result cache: {llm_cache_stats['hits']} hits / {llm_cache_stats['misses']} misses "
+            f"({llm_cache_stats['size']} stored)"
+        )
     
 # Check for keys
 if not st.session_state.newsapi_key:
@@ -335,11 +391,25 @@ with col2:
     search_btn = st.button("Search", use_container_width=True, type="primary")
 
 # Auto-load default news on first load (Logic moved before Search Handling)
+# Prefer articles pre-ingested by the background daemon (no network round-trip)
+if not st.session_state.auto_loaded:
+    default_updated_at = feed_updated_at(DEFAULT_FEED)
+    if default_updated_at and time.time() - default_updated_at < float(os.getenv('INGEST_MAX_AGE', 3600)):
+        st.session_state.feed_name = DEFAULT_FEED
+        st.session_state.feed_order = 'recent'
+        st.session_state.feed_iter = None
+        st.session_state.auto_loaded = True
+
 if not st.session_state.auto_loaded and st.session_state.newsapi_key:
     with st.spinner("Loading top headlines..."):
         refresh_articles = fetch_default_news(api_key=st.session_state.newsapi_key)
         if refresh_articles:
-            st.session_state.articles = refresh_articles
+            # A full fetch of the current headlines. It gets its own feed so the
+            # daemon's multi-region default feed is never overwritten.
+            upsert_articles(refresh_articles, feed=LIVE_FEED, replace=True)
+            st.session_state.feed_name = LIVE_FEED
+            st.session_state.feed_order = 'recent'
+            st.session_state.feed_iter = None
             st.session_state.auto_loaded = True
         else:
              st.error("❌ Failed to load news. Check your API Key or connection.")
@@ -353,19 +423,27 @@ if search_btn:
     else:
         with st.spinner(f"Fetching news about '{search_query}'..."):
             try:
-                results = search_news_by_query(
+                # Only the first page is fetched now; later pages load on demand
+                feed_iter = iter_news(
                     query=search_query,
                     api_key=st.session_state.newsapi_key,
                     page_size=st.session_state.num_articles
                 )
+                results = list(islice(feed_iter, st.session_state.num_articles))
                 
                 if not results:
                     st.warning(f"No articles found for '{search_query}'. This topic might not be in the top headlines right now.")
                 else:
-                    st.session_state.articles = results
-                    # Reset carousel
+                    feed_name = f"search:{search_query.strip().lower()}"
+                    upsert_articles(results, feed=feed_name)
+                    st.session_state.feed_name = feed_name
+                    st.session_state.feed_order = 'rank'
+                    st.session_state.feed_iter = feed_iter
+                    # Reset carousel and tab pagination
                     if 'carousel_index' in st.session_state:
                         st.session_state.carousel_index = 0
+                    for key in [k for k in st.session_state if k.startswith('feed_page_')]:
+                        del st.session_state[key]
                     st.rerun()
             except Exception as e:
                 st.error(f"❌ {str(e)}")
@@ -402,50 +480,28 @@ if st.session_state.current_view == 'article' and st.session_state.selected_arti
     </div>
     """, unsafe_allow_html=True)
     
+    # Syndicated copies folded into this story
+    if article.get('duplicates'):
+        other_sources = sorted({dup['source'] for dup in article['duplicates']})
+        st.caption(f"📎 Also reported by: {', '.join(other_sources)}")
+    
     # Fetch full article BEFORE displaying anything
     article_text = article.get('content') or article.get('description') or ''
     article_text = article_text.replace('[+', '').replace(' chars]', '').strip()
     
-    # Try to fetch full article from source if content is truncated
-    if len(article_text) < 500 or '[+' in str(article.get('content', '')):
+    # Use the prefetched full article if available, otherwise scrape it now
+    if needs_full_text(article):
         try:
-            with st.spinner("Loading full article..."):
-                news_article = NewsArticle(article['url'])
-                news_article.download()
-                news_article.parse()
-                if news_article.text and len(news_article.text) > len(article_text):
-                    # Clean the scraped text
-                    full_text = news_article.text
-                    
-                    # Remove common junk patterns
-                    junk_patterns = [
-                        'Share', 'Save', 'Getty Images', 'Share Save',
-                        'Related Topics', 'More on this story',
-                        'Sign up for', 'Subscribe to', 'Follow us on'
-                    ]
-                    
-                    # Split into lines and filter
-                    lines = full_text.split('\n')
-                    cleaned_lines = []
-                    
-                    for line in lines:
-                        line = line.strip()
-                        # Skip empty lines
-                        if not line:
-                            continue
-                        # Skip lines that are just junk
-                        if any(junk in line for junk in junk_patterns) and len(line) < 50:
-                            continue
-                        # Skip very short lines at the start (likely metadata)
-                        if len(cleaned_lines) < 3 and len(line) < 30:
-                            continue
-                        cleaned_lines.append(line)
-                    
-                    article_text = '\n\n'.join(cleaned_lines)
-                    
-                    # UPDATE: Store the full text in the article object for analysis
-                    article['content'] = article_text
-                    st.session_state.selected_article['content'] = article_text
+            full_text = get_cached_full_text(article['id'])
+            if full_text is None:
+                with st.spinner("Loading full article..."):
+                    full_text = get_prefetcher().fetch(article)
+            if full_text and len(full_text) > len(article_text):
+                article_text = full_text
+                
+                # UPDATE: Store the full text in the article object for analysis
+                article['content'] = article_text
+                st.session_state.selected_article['content'] = article_text
         except Exception as e:
             st.warning(f"⚠️ Could not fetch full article. Showing available preview.")
     
@@ -462,31 +518,53 @@ if st.session_state.current_view == 'article' and st.session_state.selected_arti
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        if st.button("Summarize", key="detail_summarize", width='stretch', type="primary"):
-            with st.spinner("Generating summary..."):
-                # Preprocess text before analysis
-                clean_content = clean_text(article['content'])
-                article['summary'] = summarize(clean_content)
-                st.session_state.selected_article = article
+        # Summary and bias stream into the results section below
+        summarize_clicked = st.button("Summarize", key="detail_summarize", width='stretch', type="primary")
     
     with col2:
         if st.button("Sentiment Analysis", key="detail_sentiment", width='stretch', type="primary"):
             with st.spinner("Analyzing sentiment..."):
-                clean_content = clean_text(article['content'])
-                article['sentiment'] = analyze_sentiment(clean_content)
+                # Score paragraph by paragraph (cleaned per segment) for a tone curve
+                article['sentiment'] = analyze_sentiment_segments(article['content'])
+                update_analysis(article['id'], sentiment=article['sentiment'])
                 st.session_state.selected_article = article
     
     with col3:
-        if st.button("Bias Detection", key="detail_bias", width='stretch', type="primary"):
-            with st.spinner("Detecting bias..."):
-                # Pass article topic for hybrid bias detection
-                article_topic = article.get('topic', 'General')
-                clean_content = clean_text(article['content'])
-                article['bias'] = detect_bias(clean_content, article_topic)
-                st.session_state.selected_article = article
+        bias_clicked = st.button("Bias Detection", key="detail_bias", width='stretch', type="primary")
+    
+    # Summary and bias from one structured call (half the round-trips and input tokens)
+    if st.button("⚡ Summarize + Detect Bias (single call)", key="detail_combined", width='stretch'):
+        with st.spinner("Analyzing article..."):
+            combined = analyze_article(clean_text(article['content']), article.get('topic', 'General'))
+        if combined['error'] is None:
+            article['summary'] = combined['summary']
+            article['bias'] = combined['bias']
+            update_analysis(article['id'], summary=article['summary'], bias=article['bias'])
+            st.session_state.selected_article = article
+        else:
+            st.error(f"❌ Analysis failed: {combined['error']}")
     
     # Display results
-    if article.get('summary'):
+    if summarize_clicked:
+        st.markdown("#### Summary")
+        # Preprocess text before analysis; tokens render as they arrive
+        # Long articles are summarized section by section first, then merged as it streams
+        summary_text = clean_text(article['content'])
+        sections = count_sections(summary_text)
+        with st.spinner(f"Summarizing {sections} sections..." if sections else "Preparing summary..."):
+            summary_stream = summarize_stream(summary_text)
+        st.write_stream(summary_stream)
+        # Errors are shown once but never saved as the article's summary
+        if summary_stream.error is None:
+            article['summary'] = summary_stream.result
+            update_analysis(article['id'], summary=article['summary'])
+            st.session_state.selected_article = article
+        if summary_stream.ttft_ms is not None:
+            st.caption(
+                f"⏱️ First token {summary_stream.ttft_ms:.0f} ms · complete {summary_stream.total_ms:.0f} ms"
+                + (" (cached)" if summary_stream.cached else "")
+            )
+    elif article.get('summary'):
         st.markdown("#### Summary")
         st.info(article['summary'])
     
@@ -495,9 +573,38 @@ if st.session_state.current_view == 'article' and st.session_state.selected_arti
         sentiment_label = article['sentiment'].get('label', 'Unknown')
         sentiment_score = article['sentiment'].get('score', 0)
         st.success(f"**{sentiment_label}** (Confidence: {sentiment_score:.2%})")
-    
-    
-    if article.get('bias'):
+        
+        # Tone across the article (older results have no curve)
+        curve = article['sentiment'].get('curve') or []
+        if len(curve) > 1:
+            curve_df = pd.DataFrame(
+                {'Sentiment': [point['compound'] for point in curve]},
+                index=pd.RangeIndex(1, len(curve) + 1, name='Segment')
+            )
+            st.line_chart(curve_df, height=200)
+            st.caption(
+                f"Tone by segment ({article['sentiment']['segments_scored']} of "
+                f"{article['sentiment']['segments_total']} scored, length-weighted overall)"
+            )
+    
+    
+    if bias_clicked:
+        st.markdown("#### Bias Analysis")
+        # Pass article topic for hybrid bias detection
+        article_topic = article.get('topic', 'General')
+        bias_stream = detect_bias_stream(clean_text(article['content']), article_topic)
+        st.write_stream(bias_stream)
+        if bias_stream.error is None:
+            article['bias'] = bias_stream.result
+            update_analysis(article['id'], bias=article['bias'])
+            st.session_state.selected_article = article
+        st.warning(f"**{bias_stream.result.get('label', 'Unknown')}**")
+        if bias_stream.ttft_ms is not None:
+            st.caption(
+                f"⏱️ First token {bias_stream.ttft_ms:.0f} ms · complete {bias_stream.total_ms:.0f} ms"
+                + (" (cached)" if bias_stream.cached else "")
+            )
+    elif article.get('bias'):
         st.markdown("#### Bias Analysis")
         bias_data = article['bias']
         
@@ -522,12 +629,23 @@ if st.session_state.current_view == 'article' and st.session_state.selected_arti
 
 # HOME VIEW - Continue with normal feed
 # Auto-Carousel for Top News (SHOW IMMEDIATELY)
-if st.session_state.articles and len(st.session_state.articles) > 0:
+feed_name = st.session_state.feed_name
+feed_order = st.session_state.feed_order
+total_articles = count_articles(feed=feed_name) if feed_name else 0
+
+# Scrape full text of the top stories in the background so "Read More" opens instantly
+if total_articles > 0:
+    prefetch_top_n = int(os.getenv('FULLTEXT_PREFETCH_TOP_N', 10))
+    get_prefetcher().prefetch(
+        query_articles(feed=feed_name, require_text=True, order=feed_order, limit=prefetch_top_n),
+        top_n=prefetch_top_n
+    )
+
+if total_articles > 0:
     # Get top 5 articles with images AND content for carousel
-    carousel_articles = [
-        a for a in st.session_state.articles 
-        if a.get('image_url') and (a.get('description') or a.get('content'))
-    ][:5]
+    carousel_articles = query_articles(
+        feed=feed_name, has_image=True, require_text=True, order=feed_order, limit=5
+    )
     
     if carousel_articles:
         # Initialize carousel index
@@ -574,32 +692,31 @@ if st.session_state.articles and len(st.session_state.articles) > 0:
 
 
 # Display articles
-if st.session_state.articles:
+if total_articles > 0:
     # Topic filter tabs
     topics = ["All", "Politics", "Technology", "Business", "Sports", "Health", "General"]
-    topic_counts = {topic: 0 for topic in topics[1:]}
-    topic_counts["All"] = len(st.session_state.articles)
-   
-    for article in st.session_state.articles:
-        topic = article.get('topic', 'General')
-        if topic in topic_counts:
-            topic_counts[topic] += 1
+    topic_counts = count_by('topic', feed=feed_name)
+    topic_counts["All"] = total_articles
+    page_size = st.session_state.num_articles
     
     tab_labels = [f"{topic} ({topic_counts.get(topic, 0)})" for topic in topics]
     tabs = st.tabs(tab_labels)
     
     for tab_idx, topic in enumerate(topics):
         with tabs[tab_idx]:
-            # Filter out articles with no description/content
-            filtered_articles = st.session_state.articles if topic == "All" else [
-                a for a in st.session_state.articles if a.get('topic') == topic
-            ]
-            
-            # Remove articles with no meaningful content
-            filtered_articles = [
-                a for a in filtered_articles 
-                if a.get('description') or a.get('content')
-            ]
+            # One page of articles with meaningful content, filtered in SQL
+            topic_filter = None if topic == "All" else topic
+            page_key = f"feed_page_{topic}"
+            page = st.session_state.get(page_key, 0)
+            matching = count_articles(feed=feed_name, topic=topic_filter, require_text=True)
+            filtered_articles = query_articles(
+                feed=feed_name,
+                topic=topic_filter,
+                require_text=True,
+                order=feed_order,
+                limit=page_size,
+                offset=page * page_size
+            )
             
             if not filtered_articles:
                 st.info(f"No articles in {topic} category")
@@ -668,6 +785,33 @@ if st.session_state.articles:
                             st.rerun()
                     
                     st.markdown("---")
+                
+                # Pagination within the tab
+                num_pages = -(-matching // page_size)
+                if num_pages > 1:
+                    p1, p2, p3 = st.columns([1, 2, 1])
+                    with p1:
+                        if page > 0 and st.button("◀ Previous", key=f"prev_page_{tab_idx}", type="secondary"):
+                            st.session_state[page_key] = page - 1
+                            st.rerun()
+                    with p2:
+                        st.caption(f"Page {page + 1} of {num_pages}")
+                    with p3:
+                        if page + 1 < num_pages and st.button("Next ▶", key=f"next_page_{tab_idx}", type="secondary"):
+                            st.session_state[page_key] = page + 1
+                            st.rerun()
+
+    # Load the next page of search results without refetching earlier ones
+    if st.session_state.feed_iter is not None:
+        if st.button("Load more", key="load_more", type="primary"):
+            with st.spinner("Loading more articles..."):
+                more = list(islice(st.session_state.feed_iter, st.session_state.num_articles))
+            if more:
+                upsert_articles(more, feed=feed_name, replace=False)
+            else:
+                # Results exhausted - hide the button
+                st.session_state.feed_iter = None
+            st.rerun()
 
 else:
     # Empty state
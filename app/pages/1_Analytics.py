@@ -9,18 +9,27 @@ import os
 # Add parent directory to path to import modules
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
-from analysis.sentiment_analyzer import analyze_sentiment
+from analysis.sentiment_analyzer import analyze_sentiment_batch, get_sentiment_cache_stats
+from storage.article_repository import query_articles, count_articles, count_by
+
+# Upper bound on articles pulled into memory for headline-level analytics
+MAX_ANALYTICS_ARTICLES = 500
 
 st.set_page_config(page_title="News Analytics", page_icon="📊", layout="wide")
 
 st.title("📊 News Intelligence Dashboard")
 
 # Check if articles exist
-if 'articles' not in st.session_state or not st.session_state.articles:
+feed_name = st.session_state.get('feed_name')
+if not feed_name or count_articles(feed=feed_name) == 0:
     st.info("👋 Go to the **Home** page first to fetch some news!")
     st.stop()
 
-articles = st.session_state.articles
+articles = query_articles(
+    feed=feed_name,
+    order=st.session_state.get('feed_order', 'rank'),
+    limit=MAX_ANALYTICS_ARTICLES
+)
 
 # ----------------- SECTION 1: AI INSIGHTS -----------------
 st.subheader("🤖 AI Insights")
@@ -37,10 +46,9 @@ with col1:
             neu_count = 0
             
             # Analyze titles only (FAST)
-            for article in articles:
-                # We use the existing local sentiment model on titles
-                # It's fast enough for 20-50 titles
-                res = analyze_sentiment(article['title'])
+            # Vectorized VADER scores the whole headline set in one NumPy pass
+            titles = [article['title'] for article in articles]
+            for res in analyze_sentiment_batch(titles, engine='vectorized'):
                 score = res['score']
                 label = res['label']
                 
@@ -72,6 +80,11 @@ with col1:
             
             # Breakdown
             st.write(f"**Positive:** {pos_count} | **Negative:** {neg_count} | **Neutral:** {neu_count}")
+            memo_stats = get_sentiment_cache_stats()
+            st.caption(
+                f"🗄️ Sentiment cache: {memo_stats['hits']} hits / {memo_stats['misses']} misses "
+                f"({memo_stats['hit_rate']:.0%} reused, {memo_stats['size']} headlines cached)"
+            )
     else:
         st.write("Click button to analyze current news cycle sentiment.")
 
@@ -104,9 +117,7 @@ col3, col4 = st.columns(2)
 
 with col3:
     st.markdown("### 📺 Topic Coverage")
-    df_topics = pd.DataFrame([a['topic'] for a in articles], columns=['Topic'])
-    topic_counts = df_topics['Topic'].value_counts().reset_index()
-    topic_counts.columns = ['Topic', 'Count']
+    topic_counts = pd.DataFrame(list(count_by('topic', feed=feed_name).items()), columns=['Topic', 'Count'])
     
     chart_topic = alt.Chart(topic_counts).mark_bar().encode(
         x='Count',
@@ -119,9 +130,7 @@ with col3:
 
 with col4:
     st.markdown("### 📢 Top Publishers")
-    df_sources = pd.DataFrame([a['source'] for a in articles], columns=['Source'])
-    source_counts = df_sources['Source'].value_counts().head(7).reset_index()
-    source_counts.columns = ['Source', 'Count']
+    source_counts = pd.DataFrame(list(count_by('source', feed=feed_name, limit=7).items()), columns=['Source', 'Count'])
     
     chart_source = alt.Chart(source_counts).mark_bar(color='#FFA500').encode(
         x='Count',
@@ -0,0 +1,74 @@
+"""
+Cold Start Benchmark
+Times, each in a fresh interpreter: importing the sentiment module, the
+first analyze_sentiment call, NLTK's own lexicon load for comparison, and
+the first render of app/streamlit_app.py (Streamlit AppTest).
+
+Usage:
+    python benchmarks/bench_cold_start.py --runs 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+PRELUDE = f"import sys, time; sys.path.insert(0, {PROJECT_ROOT!r}); start = time.perf_counter()\n"
+REPORT = "\nprint(time.perf_counter() - start)\n"
+
+SCENARIOS = {
+    "import sentiment_analyzer": "import analysis.sentiment_analyzer",
+    "import + first analyze_sentiment": (
+        "from analysis.sentiment_analyzer import analyze_sentiment\n"
+        "analyze_sentiment('Markets rally as inflation cools')"
+    ),
+    "nltk SentimentIntensityAnalyzer()": (
+        "from nltk.sentiment import SentimentIntensityAnalyzer\n"
+        "SentimentIntensityAnalyzer()"
+    ),
+    "streamlit_app.py first render": (
+        "from streamlit.testing.v1 import AppTest\n"
+        f"AppTest.from_file({os.path.join(PROJECT_ROOT, 'app', 'streamlit_app.py')!r}, default_timeout=120).run()"
+    ),
+}
+
+
+def run_once(code, env):
+    result = subprocess.run(
+        [sys.executable, "-c", PRELUDE + code + REPORT],
+        capture_output=True, text=True, env=env, cwd=PROJECT_ROOT
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--skip-app", action="store_true", help="Skip the Streamlit render scenario")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    # Render against an empty article store so the app never hits NewsAPI
+    env.setdefault("ARTICLE_DB_PATH", os.path.join(tempfile.mkdtemp(), "articles.db"))
+    env.setdefault("INGEST_MAX_AGE", str(10 ** 9))
+
+    for label, code in SCENARIOS.items():
+        if args.skip_app and "streamlit_app" in label:
+            continue
+        try:
+            times = [run_once(code, env) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(f"{label:<36} failed: {e}")
+            continue
+        print(f"{label:<36} median {statistics.median(times) * 1000:8.1f} ms  "
+              f"(min {min(times) * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Combined vs Separate Analysis Benchmark
+Per-article latency and prompt tokens of summarize() + detect_bias() (two
+round-trips) against analyze_article() (one structured call). The LLM cache
+is disabled so every article costs real calls.
+
+Usage:
+    # Live (OPENROUTER_API_KEY in .env)
+    python benchmarks/bench_combined_analysis.py --articles 5
+    # Offline, against fixtures recorded with --record
+    python benchmarks/bench_combined_analysis.py --replay --latency-ms 800
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--articles", type=int, default=5, help="Articles to analyze")
+    parser.add_argument("--record", action="store_true", help="Call live services and record fixtures")
+    parser.add_argument("--replay", action="store_true", help="Use recorded fixtures")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Injected latency per replayed call")
+    args = parser.parse_args()
+
+    os.environ["LLM_CACHE_TTL"] = "0"
+    if args.record or args.replay:
+        os.environ["REPLAY_MODE"] = "record" if args.record else "replay"
+        os.environ["REPLAY_LATENCY_MS"] = str(args.latency_ms)
+
+    from dotenv import load_dotenv
+    load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+
+    import utils.llm_client as llm_client
+    from preprocessing.ingestion.news_fetcher import fetch_default_news
+    from preprocessing.text_cleaner import clean_text
+    from generation.summarizer import summarize
+    from analysis.bias_detector import detect_bias
+    from analysis.article_analyzer import analyze_article
+
+    # Count prompt tokens reported by the API on every call
+    usage = {"calls": 0, "prompt_tokens": 0}
+    chat_completion = llm_client.chat_completion
+
+    def counting_chat_completion(client, **kwargs):
+        response = chat_completion(client, **kwargs)
+        usage["calls"] += 1
+        usage["prompt_tokens"] += getattr(response.usage, "prompt_tokens", 0) or 0
+        return response
+
+    llm_client.chat_completion = counting_chat_completion
+
+    api_key = "replay" if args.replay else os.getenv("NEWSAPI_KEY")
+    articles = [a for a in fetch_default_news(api_key) if a.get('content') or a.get('description')]
+    if not articles:
+        print("No articles (missing NEWSAPI_KEY or fixtures)")
+        return 1
+    texts = [clean_text(a['content'] or a['description']) for a in articles[:args.articles]]
+
+    def separate(text):
+        summarize(text)
+        detect_bias(text)
+
+    def combined(text):
+        result = analyze_article(text)
+        if not result["combined"]:
+            print("   (combined call fell back to separate calls)")
+
+    print(f"{'mode':<10} {'p50 ms':>9} {'mean ms':>9} {'calls':>6} {'prompt tok':>11}")
+    for name, fn in (("separate", separate), ("combined", combined)):
+        usage.update(calls=0, prompt_tokens=0)
+        timings = []
+        for text in texts:
+            start = time.perf_counter()
+            fn(text)
+            timings.append((time.perf_counter() - start) * 1000)
+        print(
+            f"{name:<10} {statistics.median(timings):9.1f} {statistics.mean(timings):9.1f} "
+            f"{usage['calls']:6d} {usage['prompt_tokens']:11d}"
+        )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
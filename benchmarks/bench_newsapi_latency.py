@@ -0,0 +1,107 @@
+"""
+NewsAPI Fetch Latency Benchmark
+Measures p50/p99 of the pooled NewsAPI client against a local stub server,
+compared with a fresh connection per request (the previous behaviour).
+
+Usage:
+    python benchmarks/bench_newsapi_latency.py --requests 200 --fail-every 10
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+STUB_RESPONSE = json.dumps({
+    "status": "ok",
+    "totalResults": 1,
+    "articles": [{
+        "source": {"name": "Stub"},
+        "title": "Stub headline",
+        "description": "Stub description",
+        "url": "https://example.com/stub",
+        "publishedAt": "2024-01-01T00:00:00Z",
+        "content": "Stub content"
+    }]
+}).encode('utf-8')
+
+
+def start_stub_server(fail_every=0):
+    """Starts a NewsAPI-shaped HTTP server; every `fail_every`-th request gets a 429."""
+    counter = {"n": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Allow keep-alive
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            with lock:
+                counter["n"] += 1
+                fail = fail_every and counter["n"] % fail_every == 0
+            if fail:
+                self.send_response(429)
+                self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(STUB_RESPONSE)))
+            self.end_headers()
+            self.wfile.write(STUB_RESPONSE)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return (samples[len(samples) // 2] * 1000,
+            samples[min(len(samples) - 1, int(0.99 * len(samples)))] * 1000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--fail-every", type=int, default=0,
+                        help="Answer every N-th request with 429 to exercise retries")
+    args = parser.parse_args()
+
+    server = start_stub_server(args.fail_every)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ["NEWSAPI_BASE_URL"] = base_url
+    os.environ["NEWSAPI_RETRY_BACKOFF"] = "0"
+
+    import requests
+    from preprocessing.ingestion import news_fetcher
+
+    # Baseline: new connection for every request (no session, no retries)
+    baseline = []
+    for i in range(args.requests):
+        start = time.perf_counter()
+        requests.get(f"{base_url}/v2/everything", params={"q": f"q{i}"}, timeout=30)
+        baseline.append(time.perf_counter() - start)
+
+    # Pooled client; unique queries so the response cache never short-circuits
+    for i in range(args.requests):
+        news_fetcher._call_newsapi("bench-key", "everything", q=f"q{i}", page_size=1)
+
+    p50, p99 = percentiles(baseline)
+    stats = news_fetcher.get_fetch_latency_stats()
+    print(f"fresh connection : p50={p50:.2f}ms p99={p99:.2f}ms (n={len(baseline)})")
+    print(f"pooled + retries : p50={stats['p50_ms']:.2f}ms p99={stats['p99_ms']:.2f}ms (n={stats['count']})")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
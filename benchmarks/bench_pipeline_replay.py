@@ -0,0 +1,65 @@
+"""
+Offline Pipeline Benchmark
+Times fetch -> process -> summarize/bias against recorded NewsAPI and
+OpenRouter responses, so runs are reproducible on an air-gapped machine.
+
+Usage:
+    # 1. Record fixtures once (live keys required)
+    python benchmarks/bench_pipeline_replay.py --record --articles 5
+    # 2. Replay offline, with 800ms of simulated LLM/API latency
+    python benchmarks/bench_pipeline_replay.py --latency-ms 800 --articles 5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+def timed(label, fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    print(f"{label:<28} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--record", action="store_true", help="Call live services and record fixtures")
+    parser.add_argument("--articles", type=int, default=5, help="Articles to summarize / bias-check")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Injected latency per replayed call")
+    parser.add_argument("--fixtures", default=None, help="Fixture directory (REPLAY_DIR)")
+    args = parser.parse_args()
+
+    os.environ["REPLAY_MODE"] = "record" if args.record else "replay"
+    os.environ["REPLAY_LATENCY_MS"] = str(args.latency_ms)
+    if args.fixtures:
+        os.environ["REPLAY_DIR"] = args.fixtures
+
+    from dotenv import load_dotenv
+    load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+
+    from preprocessing.ingestion.news_fetcher import fetch_default_news
+    from preprocessing.text_cleaner import clean_text
+    from generation.summarizer import summarize
+    from analysis.bias_detector import detect_bias
+
+    api_key = os.getenv("NEWSAPI_KEY") if args.record else "replay"
+    articles = timed("fetch + process", fetch_default_news, api_key)
+    if not articles:
+        print("No articles (missing fixtures? run once with --record)")
+        return 1
+
+    total = time.perf_counter()
+    for article in articles[:args.articles]:
+        text = clean_text(article['content'] or article['description'] or '')
+        timed(f"summarize {article['id'][-8:]}", summarize, text)
+        timed(f"bias      {article['id'][-8:]}", detect_bias, text, article['topic'])
+    print(f"{'analysis total':<28} {(time.perf_counter() - total) * 1000:9.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+Sentiment Batch Benchmark
+Throughput of the serial analyze_sentiment loop vs analyze_sentiment_batch
+(process pool) on synthetic full-length article bodies. The sentiment memo
+cache is emptied before every timed run (and never persisted), so each run
+scores every document.
+
+Usage:
+    python benchmarks/bench_sentiment_batch.py --sizes 1000,10000,100000 --words 600
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Keep the benchmark away from any persisted memo file
+os.environ['SENTIMENT_CACHE_PATH'] = ''
+
+from analysis.sentiment_analyzer import (
+    analyze_sentiment, analyze_sentiment_batch, clear_sentiment_cache, get_sentiment_cache_stats
+)
+
+WORDS = ("the a of to in and said on for with was that by at from officials reported "
+         "statement week city people year told added according local state police court "
+         "good great strong growth win success bad terrible weak crisis loss failure "
+         "not very extremely hardly but").split()
+
+
+def make_docs(count, words, seed=7):
+    rng = random.Random(seed)
+    docs = []
+    for _ in range(count):
+        sentences = []
+        for _ in range(max(1, words // 20)):
+            sentence = ' '.join(rng.choice(WORDS) for _ in range(20)).capitalize()
+            sentences.append(sentence + rng.choice(['.', '.', '!', '?']))
+        docs.append(' '.join(sentences))
+    return docs
+
+
+def timed(label, fn, docs):
+    # Cold memo: earlier runs over the same docs must not turn this into cache lookups
+    clear_sentiment_cache()
+    start = time.perf_counter()
+    results = fn(docs)
+    elapsed = time.perf_counter() - start
+    hits = get_sentiment_cache_stats().get('hits', 0)
+    print(f"{label:<30} {elapsed:9.2f} s  ({len(docs) / elapsed:9.0f} docs/s, {hits} memo hits)")
+    return results, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated document counts")
+    parser.add_argument("--words", type=int, default=600, help="Words per document")
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size (default: CPU count)")
+    parser.add_argument("--skip-serial-above", type=int, default=10000,
+                        help="Estimate the serial time from the previous size above this count")
+    args = parser.parse_args()
+
+    serial_rate = None
+    for size in (int(s) for s in args.sizes.split(',')):
+        docs = make_docs(size, args.words)
+        print(f"\n{size} docs, ~{args.words} words each")
+        if size <= args.skip_serial_above or serial_rate is None:
+            serial, serial_time = timed("analyze_sentiment loop", lambda d: [analyze_sentiment(t) for t in d], docs)
+            serial_rate = size / serial_time
+        else:
+            serial, serial_time = None, size / serial_rate
+            print(f"{'analyze_sentiment loop (est.)':<30} {serial_time:9.2f} s")
+        batch, batch_time = timed(
+            "analyze_sentiment_batch",
+            lambda d: list(analyze_sentiment_batch(d, max_workers=args.workers, parallel_threshold=0)),
+            docs
+        )
+        print(f"{'speedup':<30} {serial_time / batch_time:9.2f}x")
+        if serial is not None:
+            print(f"{'identical results':<30} {serial == batch}")
+
+
+if __name__ == "__main__":
+    main()
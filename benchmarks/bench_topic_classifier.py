@@ -0,0 +1,81 @@
+"""
+Topic Classifier Benchmark
+Compares the Aho-Corasick keyword matcher with the previous
+one-substring-scan-per-keyword approach on NewsAPI-sized snippets and
+full scraped article bodies, and checks that the batch classify_topics API
+matches classify_topic on a re-labelling sized archive.
+
+Usage:
+    python benchmarks/bench_topic_classifier.py --docs 2000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from classification.topic_classifier import TOPIC_KEYWORDS, classify_topic, classify_topics
+
+FILLER = ("the a of to in and said on for with was that by at from his her it as "
+          "officials reported statement week city people year told added per cent "
+          "according local state district police court board region plan").split()
+
+
+def substring_scores(text):
+    """Previous implementation: one full scan of the text per keyword."""
+    text_lower = text.lower()
+    return {topic: sum(1 for keyword in keywords if keyword in text_lower)
+            for topic, keywords in TOPIC_KEYWORDS.items()}
+
+
+def make_docs(count, words, seed=7):
+    rng = random.Random(seed)
+    keywords = [k for ks in TOPIC_KEYWORDS.values() for k in ks]
+    docs = []
+    for _ in range(count):
+        tokens = [rng.choice(keywords) if rng.random() < 0.04 else rng.choice(FILLER)
+                  for _ in range(words)]
+        docs.append(' '.join(tokens).capitalize() + '.')
+    return docs
+
+
+def bench(label, fn, docs):
+    start = time.perf_counter()
+    for doc in docs:
+        fn(doc)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed * 1000:9.1f} ms  ({len(docs) / elapsed:10.0f} docs/s)")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--archive", type=int, default=20000, help="Archive size for the batch run")
+    args = parser.parse_args()
+
+    for name, words in (("snippet (~40 words)", 40), ("full body (~900 words)", 900)):
+        docs = make_docs(args.docs, words)
+        print(f"\n{name}, {args.docs} docs")
+        old = bench("substring scan per keyword", substring_scores, docs)
+        new = bench("aho-corasick (classify_topic)", classify_topic, docs)
+        print(f"{'speedup':<34} {old / new:9.2f}x")
+
+    docs = make_docs(args.archive, 120)
+    print(f"\narchive re-labelling (~120 words), {args.archive} docs")
+    start = time.perf_counter()
+    scalar = [classify_topic(doc) for doc in docs]
+    scalar_time = time.perf_counter() - start
+    print(f"{'classify_topic loop':<34} {scalar_time * 1000:9.1f} ms")
+    start = time.perf_counter()
+    batch = classify_topics(docs)
+    batch_time = time.perf_counter() - start
+    print(f"{'classify_topics batch':<34} {batch_time * 1000:9.1f} ms")
+    print(f"{'identical results':<34} {scalar == batch}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Hashed Topic Model Benchmark
+Single-core training and batch inference throughput of the Naive Bayes
+topic model, plus its agreement with the keyword labels it was trained on.
+
+Usage:
+    python benchmarks/bench_topic_model.py --docs 20000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from classification.topic_classifier import TOPIC_KEYWORDS
+from classification.linear_topic_model import HashedTopicModel, keyword_training_labels
+
+FILLER = ("the a of to in and said on for with was that by at from officials "
+          "reported week city people year told added according local state").split()
+
+
+def make_docs(count, words, seed):
+    """Topic-coherent synthetic articles: filler words plus keywords of one topic."""
+    rng = random.Random(seed)
+    topics = list(TOPIC_KEYWORDS)
+    docs = []
+    for _ in range(count):
+        keywords = TOPIC_KEYWORDS[rng.choice(topics)]
+        docs.append(' '.join(rng.choice(keywords) if rng.random() < 0.06 else rng.choice(FILLER)
+                             for _ in range(words)))
+    return docs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--docs", type=int, default=20000)
+    parser.add_argument("--words", type=int, default=150)
+    args = parser.parse_args()
+
+    texts, labels = keyword_training_labels(make_docs(args.docs, args.words, seed=1))
+    start = time.perf_counter()
+    model = HashedTopicModel().partial_fit(texts, labels)
+    elapsed = time.perf_counter() - start
+    print(f"train     {len(texts):7d} docs  {elapsed * 1000:9.1f} ms  ({len(texts) / elapsed:8.0f} docs/s)")
+
+    test_texts, test_labels = keyword_training_labels(make_docs(args.docs, args.words, seed=2))
+    start = time.perf_counter()
+    results = model.classify_batch(test_texts)
+    elapsed = time.perf_counter() - start
+    print(f"inference {len(test_texts):7d} docs  {elapsed * 1000:9.1f} ms  ({len(test_texts) / elapsed:8.0f} docs/s)")
+
+    agreement = sum(r['label'] == l for r, l in zip(results, test_labels)) / max(1, len(test_labels))
+    print(f"agreement with keyword labels: {agreement:.1%}")
+
+
+if __name__ == "__main__":
+    main()
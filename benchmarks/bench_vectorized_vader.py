@@ -0,0 +1,73 @@
+"""
+Vectorized VADER Benchmark
+Compares NLTK's polarity_scores loop with the NumPy VectorizedVader on a
+synthetic headline history, and reports the largest compound-score
+difference between the two.
+
+Usage:
+    python benchmarks/bench_vectorized_vader.py --headlines 50000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from analysis.sentiment_analyzer import build_analyzer
+from analysis.vectorized_vader import VectorizedVader
+
+FILLER = ("the a of to in and for with on at from as after over amid says new "
+          "government market minister police court city team company report").split()
+MODIFIERS = ("not never very extremely hardly kind of sort but least at so this "
+             "don't isn't without").split()
+
+
+def make_headlines(count, lexicon_words, seed=7):
+    rng = random.Random(seed)
+    headlines = []
+    for _ in range(count):
+        tokens = []
+        for _ in range(rng.randint(6, 14)):
+            roll = rng.random()
+            if roll < 0.15:
+                tokens.append(rng.choice(lexicon_words))
+            elif roll < 0.25:
+                tokens.append(rng.choice(MODIFIERS))
+            else:
+                tokens.append(rng.choice(FILLER))
+        if rng.random() < 0.05:
+            tokens[rng.randrange(len(tokens))] = tokens[0].upper()
+        headlines.append(' '.join(tokens).capitalize() + rng.choice(['', '', '!', '?', '...']))
+    return headlines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--headlines", type=int, default=50000)
+    args = parser.parse_args()
+
+    sia = build_analyzer()
+    scorer = VectorizedVader(sia.lexicon)
+    headlines = make_headlines(args.headlines, [w for w in sia.lexicon if w.isalpha()])
+
+    start = time.perf_counter()
+    reference = np.array([sia.polarity_scores(h)['compound'] for h in headlines])
+    nltk_time = time.perf_counter() - start
+    print(f"{'nltk polarity_scores loop':<30} {nltk_time * 1000:9.1f} ms  ({len(headlines) / nltk_time:9.0f} docs/s)")
+
+    start = time.perf_counter()
+    compound = scorer.compound_scores(headlines)
+    vector_time = time.perf_counter() - start
+    print(f"{'VectorizedVader':<30} {vector_time * 1000:9.1f} ms  ({len(headlines) / vector_time:9.0f} docs/s)")
+
+    print(f"{'speedup':<30} {nltk_time / vector_time:9.2f}x")
+    print(f"{'max |compound difference|':<30} {np.abs(reference - compound).max():9.5f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""
+Linear Topic Model
+Optional local classifier: hashed unigram + bigram features with a
+multinomial Naive Bayes model in NumPy. Trained incrementally from the
+keyword classifier's labels plus manual corrections, stored as a compact
+.npz file, and plugged in behind classify_topic / classify_topics.
+
+A plain-text log next to the model (<model>.trained_ids.txt) records which
+articles and corrections were already trained on, so each training run only
+adds new examples. Only the trainer reads it; the .npz stays compact.
+
+Usage:
+    python -m classification.linear_topic_model --corrections corrections.jsonl --model data/topic_model.npz
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import zlib
+
+import numpy as np
+
+TOPIC_LABELS = ["Politics", "Technology", "Business", "Sports", "Health", "General"]
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+class HashedTopicModel:
+    """
+    Multinomial Naive Bayes over hashed n-gram features.
+
+    Args:
+        labels: Class labels, in output order
+        n_features: Hash space size (power of two)
+        alpha: Additive smoothing
+    """
+
+    def __init__(self, labels=TOPIC_LABELS, n_features=2 ** 18, alpha=0.1):
+        if n_features & (n_features - 1):
+            raise ValueError("n_features must be a power of two")
+        self.labels = list(labels)
+        self.n_features = n_features
+        self.alpha = alpha
+        self.feature_counts = np.zeros((len(self.labels), n_features), dtype=np.float32)
+        self.class_counts = np.zeros(len(self.labels), dtype=np.float64)
+        self._params = None  # (log_prob, log_prior), replaced as one tuple
+
+    # ----------------- FEATURES -----------------
+    def _hash_tokens(self, text):
+        tokens = _TOKEN_RE.findall((text or '').lower())
+        grams = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        mask = self.n_features - 1
+        return [zlib.crc32(g.encode('utf-8')) & mask for g in grams]
+
+    def _vectorize(self, texts):
+        """
+        Hashed features of every text as flat (document index, feature index)
+        arrays, one entry per n-gram occurrence.
+        """
+        lengths = []
+        indices = []
+        for text in texts:
+            hashed = self._hash_tokens(text)
+            indices.extend(hashed)
+            lengths.append(len(hashed))
+        docs = np.repeat(np.arange(len(lengths)), lengths)
+        return docs, np.asarray(indices, dtype=np.int64)
+
+    # ----------------- TRAINING -----------------
+    def partial_fit(self, texts, labels, weight=1.0):
+        """
+        Adds a batch of labelled texts to the model.
+
+        Args:
+            texts: Training texts
+            labels: One label per text (unknown labels are skipped)
+            weight: Sample weight, e.g. >1 for manual corrections
+        """
+        pairs = [(t, self.labels.index(l)) for t, l in zip(texts, labels) if l in self.labels]
+        if not pairs:
+            return self
+        docs, indices = self._vectorize([t for t, _ in pairs])
+        y = np.array([l for _, l in pairs])
+
+        # Every n-gram occurrence adds `weight` to its document's label row
+        np.add.at(self.feature_counts, (y[docs], indices), np.float32(weight))
+        self.class_counts += np.bincount(y, minlength=len(self.labels)) * weight
+        self._params = None
+        return self
+
+    def _fitted_params(self):
+        """
+        (log_prob, log_prior). Both are computed before being published in a
+        single assignment, so concurrent readers never see half a model.
+        """
+        params = self._params
+        if params is not None:
+            return params
+        if not self.class_counts.any():
+            raise ValueError("Model has not been trained")
+        smoothed = self.feature_counts.astype(np.float64) + self.alpha
+        log_prob = (np.log(smoothed) - np.log(smoothed.sum(axis=1, keepdims=True))).T.astype(np.float32)
+        log_prior = np.log((self.class_counts + 1) / (self.class_counts.sum() + len(self.labels)))
+        self._params = (log_prob, log_prior)
+        return self._params
+
+    # ----------------- INFERENCE -----------------
+    def predict_proba(self, texts):
+        """Returns a (len(texts), len(labels)) array of class probabilities."""
+        log_prob, log_prior = self._fitted_params()
+        texts = list(texts)
+        docs, indices = self._vectorize(texts)
+        # Documents are contiguous runs in `indices`; texts without features keep 0
+        lengths = np.bincount(docs, minlength=len(texts))
+        starts = np.cumsum(lengths) - lengths
+        joint = np.zeros((len(texts), len(self.labels)), dtype=np.float64)
+        nonempty = lengths > 0
+        if nonempty.any():
+            joint[nonempty] = np.add.reduceat(log_prob[indices], starts[nonempty], axis=0)
+        joint += log_prior
+        joint -= joint.max(axis=1, keepdims=True)
+        proba = np.exp(joint)
+        return proba / proba.sum(axis=1, keepdims=True)
+
+    def classify_batch(self, texts):
+        """classify_topic-shaped results for a batch of texts."""
+        texts = list(texts)
+        if not texts:
+            return []
+        proba = self.predict_proba(texts)
+        best = proba.argmax(axis=1)
+        results = []
+        for i, text in enumerate(texts):
+            if not text:
+                results.append({"label": "General", "confidence": 0.0, "all_scores": {}})
+                continue
+            results.append({
+                "label": self.labels[best[i]],
+                "confidence": float(proba[i, best[i]]),
+                "all_scores": dict(zip(self.labels, proba[i].round(4).tolist()))
+            })
+        return results
+
+    def classify(self, text):
+        """classify_topic-shaped result for one text."""
+        return self.classify_batch([text])[0]
+
+    # ----------------- PERSISTENCE -----------------
+    def save(self, path):
+        """Writes the model as a compressed .npz file (atomically)."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp.npz"
+        np.savez_compressed(
+            tmp_path,
+            labels=np.array(self.labels),
+            feature_counts=self.feature_counts,
+            class_counts=self.class_counts,
+            alpha=np.array(self.alpha)
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Loads a model written by save()."""
+        with np.load(path) as data:
+            model = cls(
+                labels=data['labels'].tolist(),
+                n_features=data['feature_counts'].shape[1],
+                alpha=float(data['alpha'])
+            )
+            model.feature_counts = data['feature_counts'].astype(np.float32)
+            model.class_counts = data['class_counts'].astype(np.float64)
+        return model
+
+
+def keyword_training_labels(texts, min_confidence=0.4):
+    """
+    Weak labels from the keyword classifier: (texts, labels) for texts it is
+    reasonably confident about.
+    """
+    from classification.topic_classifier import classify_topics
+
+    kept_texts, labels = [], []
+    for text, result in zip(texts, classify_topics(texts, use_model=False)):
+        if text and result['confidence'] >= min_confidence:
+            kept_texts.append(text)
+            labels.append(result['label'])
+    return kept_texts, labels
+
+
+def trained_ids_path(model_path):
+    """Training log kept next to the model file."""
+    return f"{os.path.splitext(model_path)[0]}.trained_ids.txt"
+
+
+def load_trained_ids(path):
+    """Article IDs / correction keys already trained on (empty if no log yet)."""
+    if not os.path.exists(path):
+        return set()
+    with open(path, 'r', encoding='utf-8') as f:
+        return {line.strip() for line in f if line.strip()}
+
+
+def save_trained_ids(path, trained_ids):
+    """Writes the training log atomically."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.writelines(f"{item}\n" for item in sorted(trained_ids))
+    os.replace(tmp_path, path)
+
+
+def correction_key(row):
+    """Stable key of a manual correction, so re-applying a file is a no-op."""
+    digest = hashlib.sha1(f"{row['label']}\n{row['text']}".encode('utf-8')).hexdigest()
+    return f"correction:{digest}"
+
+
+def main(argv=None):
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    from classification.topic_classifier import TOPIC_MODEL_PATH
+    from storage.article_repository import query_articles, DEFAULT_DB_PATH
+
+    parser = argparse.ArgumentParser(description="Train the hashed topic model incrementally")
+    parser.add_argument('--model', default=TOPIC_MODEL_PATH, help="Model file to update")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="Article database with keyword-labelled articles")
+    parser.add_argument('--corrections', default=None,
+                        help='JSONL file of {"text": ..., "label": ...} manual corrections')
+    parser.add_argument('--correction-weight', type=float, default=5.0)
+    parser.add_argument('--min-confidence', type=float, default=0.4)
+    args = parser.parse_args(argv)
+
+    model = HashedTopicModel.load(args.model) if os.path.exists(args.model) else HashedTopicModel()
+    log_path = trained_ids_path(args.model)
+    trained_ids = load_trained_ids(log_path) if os.path.exists(args.model) else set()
+
+    # Only articles this model has not been trained on yet
+    articles = query_articles(limit=None, db_path=args.db) if os.path.exists(args.db) else []
+    articles = [a for a in articles if a['id'] not in trained_ids]
+    texts = [f"{a.get('title') or ''} {a.get('content') or a.get('description') or ''}" for a in articles]
+    weak_texts, weak_labels = keyword_training_labels(texts, args.min_confidence)
+    model.partial_fit(weak_texts, weak_labels)
+    # Low-confidence articles are marked too: their keyword label will not change
+    trained_ids.update(a['id'] for a in articles)
+    print(f"📚 Trained on {len(weak_texts)} new keyword-labelled articles ({len(articles)} new in DB)")
+
+    if args.corrections:
+        with open(args.corrections, 'r', encoding='utf-8') as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+        new_rows = [r for r in rows if correction_key(r) not in trained_ids]
+        model.partial_fit([r['text'] for r in new_rows], [r['label'] for r in new_rows], weight=args.correction_weight)
+        trained_ids.update(correction_key(r) for r in new_rows)
+        print(f"✏️ Applied {len(new_rows)} new corrections ({len(rows) - len(new_rows)} already applied)")
+
+    model.save(args.model)
+    save_trained_ids(log_path, trained_ids)
+    print(f"✅ Saved model to {args.model}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
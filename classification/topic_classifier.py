@@ -3,6 +3,17 @@ Topic Classifier
 Enhanced keyword-based classification for news articles.
 """
 
+import os
+import re
+import threading
+from collections import deque
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Optional trained model (classification/linear_topic_model.py) used instead of keywords
+TOPIC_MODEL_PATH = os.getenv('TOPIC_MODEL_PATH') or os.path.join(PROJECT_ROOT, 'data', 'topic_model.npz')
+USE_TOPIC_MODEL = os.getenv('USE_TOPIC_MODEL', '').lower() in ('1', 'true', 'yes')
+
 # Comprehensive keyword lists for each topic
 TOPIC_KEYWORDS = {
     "Politics": [
@@ -38,26 +49,152 @@ TOPIC_KEYWORDS = {
     ]
 }
 
-def classify_topic(text):
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+class _KeywordAutomaton:
+    """
+    Aho-Corasick automaton over word tokens.
+
+    Keywords are compiled once into a trie of words with failure links, so a
+    text is matched against every keyword in a single pass over its tokens.
+    Matching whole tokens makes it word-boundary aware ("ai" no longer hits
+    inside "said"); simple plurals ("elections", "viruses") still match.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        self.vocab = set()
+        self.goto = [{}]
+        self.output = [[]]
+
+        # Trie of keyword word sequences
+        for kw_idx, keyword in enumerate(self.keywords):
+            state = 0
+            for word in keyword.split():
+                self.vocab.add(word)
+                if word not in self.goto[state]:
+                    self.goto.append({})
+                    self.output.append([])
+                    self.goto[state][word] = len(self.goto) - 1
+                state = self.goto[state][word]
+            self.output[state].append(kw_idx)
+
+        # Failure links (breadth-first), merging outputs along the chain
+        self.fail = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and word not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(word, 0)
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+        # Token -> keyword word, including simple plural forms
+        self.token_map = {}
+        for word in self.vocab:
+            self.token_map.setdefault(word + 'es', word)
+            self.token_map.setdefault(word + 's', word)
+        self.token_map.update({word: word for word in self.vocab})
+
+    def count(self, text_lower):
+        """Returns {keyword index: occurrences} for a lowercased text."""
+        counts = {}
+        goto, fail, output, token_map = self.goto, self.fail, self.output, self.token_map
+        state = 0
+        for token in _TOKEN_RE.findall(text_lower):
+            word = token_map.get(token)
+            if word is None:
+                # No keyword contains this word: restart from the root
+                state = 0
+                continue
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0)
+            for kw_idx in output[state]:
+                counts[kw_idx] = counts.get(kw_idx, 0) + 1
+        return counts
+
+def _build_keyword_index():
+    """Unique keywords plus, for each, the topics listing it (with repeats)."""
+    keyword_topics = {}
+    for topic, keywords in TOPIC_KEYWORDS.items():
+        for keyword in keywords:
+            keyword_topics.setdefault(keyword, []).append(topic)
+    keywords = list(keyword_topics)
+    return _KeywordAutomaton(keywords), [keyword_topics[k] for k in keywords]
+
+_AUTOMATON, _KEYWORD_TOPICS = _build_keyword_index()
+
+def count_topic_hits(text):
+    """
+    Matches all topic keywords against `text` in one pass.
+
+    Returns:
+        tuple: ({topic: distinct keywords matched}, {topic: total keyword occurrences})
     """
-    Classifies text into one of the predefined topics using keyword matching.
+    scores = {topic: 0 for topic in TOPIC_KEYWORDS}
+    hits = {topic: 0 for topic in TOPIC_KEYWORDS}
+    if not text:
+        return scores, hits
+
+    for kw_idx, occurrences in _AUTOMATON.count(text.lower()).items():
+        for topic in _KEYWORD_TOPICS[kw_idx]:
+            scores[topic] += 1
+            hits[topic] += occurrences
+    return scores, hits
+
+_topic_model = None
+_topic_model_loaded = False
+_topic_model_lock = threading.Lock()
+
+def set_topic_model(model):
+    """Routes classify_topic / classify_topics through `model` (None = keywords only)."""
+    global _topic_model, _topic_model_loaded
+    with _topic_model_lock:
+        _topic_model = model
+        _topic_model_loaded = True
+
+def get_topic_model():
+    """Returns the active trained model, loading TOPIC_MODEL_PATH once if USE_TOPIC_MODEL is set."""
+    global _topic_model, _topic_model_loaded
+    if _topic_model_loaded:
+        return _topic_model
+    with _topic_model_lock:
+        if not _topic_model_loaded:
+            if USE_TOPIC_MODEL and os.path.exists(TOPIC_MODEL_PATH):
+                try:
+                    from classification.linear_topic_model import HashedTopicModel
+                    _topic_model = HashedTopicModel.load(TOPIC_MODEL_PATH)
+                except Exception as e:
+                    print(f"⚠️ Could not load topic model {TOPIC_MODEL_PATH}: {e}")
+            _topic_model_loaded = True
+    return _topic_model
+
+def classify_topic(text, use_model=True):
+    """
+    Classifies text into one of the predefined topics using keyword matching
+    (or the trained model, if one is active and `use_model` is True).
     
     Args:
         text: Article text to classify
+        use_model: Allow the trained model to answer instead of the keywords
         
     Returns:
-        dict: Classification result with label, confidence, and all scores
+        dict: Classification result with label, confidence, all scores
+              (distinct keywords per topic) and hit counts (occurrences per topic)
     """
     if not text:
         return {"label": "General", "confidence": 0.0, "all_scores": {}}
     
-    text_lower = text.lower()
+    model = get_topic_model() if use_model else None
+    if model is not None:
+        return model.classify(text)
     
-    # Count keyword matches for each topic
-    topic_scores = {}
-    for topic, keywords in TOPIC_KEYWORDS.items():
-        score = sum(1 for keyword in keywords if keyword in text_lower)
-        topic_scores[topic] = score
+    # Count keyword matches for each topic (single automaton pass)
+    topic_scores, topic_hits = count_topic_hits(text)
     
     # Get the topic with highest score
     max_score = max(topic_scores.values())
@@ -68,12 +205,39 @@ def classify_topic(text):
         return {
             "label": best_topic,
             "confidence": confidence,
-            "all_scores": topic_scores
+            "all_scores": topic_scores,
+            "hit_counts": topic_hits
         }
     
     # Default to General if no keywords match
     return {
         "label": "General",
         "confidence": 0.5,
-        "all_scores": topic_scores
+        "all_scores": topic_scores,
+        "hit_counts": topic_hits
     }
+
+def classify_topics(texts, use_model=True):
+    """
+    Batch version of classify_topic.
+
+    With a trained model active, the whole batch is scored in one vectorized
+    predict. Keyword classification runs the automaton per text (tokenizing
+    dominates its cost), so it is a convenience API rather than a speedup.
+
+    Args:
+        texts: Iterable of article texts
+        use_model: Allow the trained model to answer instead of the keywords
+
+    Returns:
+        list: One classification dict per text, same shape as classify_topic
+    """
+    texts = list(texts)
+    if not texts:
+        return []
+
+    model = get_topic_model() if use_model else None
+    if model is not None:
+        return model.classify_batch(texts)
+
+    return [classify_topic(text, use_model=False) for text in texts]
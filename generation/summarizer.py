@@ -1,26 +1,100 @@
 """
 News Summarizer - Powered by OpenAI GPT-4o
 Uses state-of-the-art LLM for comprehensive, high-quality news summarization.
+
+Articles longer than the model's chunk budget are map-reduced: the text is
+split on sentence boundaries into chunks, the chunks are summarized in
+parallel and the partial summaries are merged in one final call, so latency
+is bounded by the slowest chunk rather than the article length.
+
+Configuration (environment):
+    SUMMARY_CHUNK_TOKENS  Chunk budget in tokens, overrides CHUNK_TOKEN_BUDGETS
+    SUMMARY_MAP_WORKERS   Chunks summarized concurrently (default: 8)
 """
 
 import streamlit as st
 import os
-from openai import OpenAI
-from utils.prompts import SUMMARIZATION_SYSTEM_PROMPT, get_summary_prompt
-
-def get_openai_client():
-    """Initialize OpenRouter client"""
-    api_key = os.getenv("OPENROUTER_API_KEY")
-    if not api_key:
-        return None
-    
-    # Clean the key key just in case
-    api_key = api_key.strip().strip("'").strip('"')
-    print(f"🔑 Loaded OpenRouter Key: {api_key[:5]}...{api_key[-3:] if len(api_key)>10 else ''}")
-    
-    return OpenAI(
-        base_url="https://openrouter.ai/api/v1",
-        api_key=api_key,
+import time
+from concurrent.futures import ThreadPoolExecutor
+from utils.prompts import (
+    SUMMARIZATION_SYSTEM_PROMPT, get_summary_prompt,
+    get_chunk_summary_prompt, get_reduce_summary_prompt
+)
+from utils.llm_client import get_openai_client, cached_completion, CompletionStream
+from preprocessing.text_chunker import chunk_text, estimate_tokens
+
+SUMMARY_MODEL = "openai/gpt-4o" # OpenRouter model ID
+
+# Max input tokens per summarization call. Well below the context windows:
+# smaller chunks keep each call fast and are summarized in parallel.
+CHUNK_TOKEN_BUDGETS = {
+    "openai/gpt-4o": 3000,
+    "openai/gpt-4o-mini": 3000,
+}
+DEFAULT_CHUNK_TOKENS = 2000
+MAP_WORKERS = int(os.getenv('SUMMARY_MAP_WORKERS', 8))
+
+def get_chunk_budget(model=SUMMARY_MODEL):
+    """Token budget per summarization call for `model`."""
+    override = os.getenv('SUMMARY_CHUNK_TOKENS')
+    if override:
+        return int(override)
+    return CHUNK_TOKEN_BUDGETS.get(model, DEFAULT_CHUNK_TOKENS)
+
+def needs_map_reduce(text, model=SUMMARY_MODEL):
+    """True when `text` does not fit in a single summarization call."""
+    return estimate_tokens(text) > get_chunk_budget(model)
+
+def count_sections(text, model=SUMMARY_MODEL):
+    """Number of chunks the map step summarizes first (0 for a single call)."""
+    if not needs_map_reduce(text, model):
+        return 0
+    return len(chunk_text(text, get_chunk_budget(model)))
+
+def _summarize_chunk(client, chunk, index, total):
+    return cached_completion(
+        client,
+        "summary_chunk",
+        f"{index}/{total}\n{chunk}",
+        model=SUMMARY_MODEL,
+        system_prompt=SUMMARIZATION_SYSTEM_PROMPT,
+        user_prompt=get_chunk_summary_prompt(chunk, index, total),
+        temperature=0.3,
+        max_tokens=400
+    )
+
+def _map_summaries(client, text):
+    """
+    Map step: summarizes each chunk of `text` concurrently. If the partial
+    summaries together still exceed the budget (very long articles), they
+    are chunked and summarized again (up to 3 rounds).
+
+    Returns:
+        list[str]: Partial summaries in document order
+    """
+    budget = get_chunk_budget()
+    for _ in range(3):
+        chunks = chunk_text(text, budget)
+        with ThreadPoolExecutor(max_workers=min(MAP_WORKERS, len(chunks)), thread_name_prefix='summary-map') as executor:
+            partials = list(executor.map(
+                lambda args: _summarize_chunk(client, args[1], args[0], len(chunks)),
+                enumerate(chunks, start=1)
+            ))
+        if len(partials) == 1 or estimate_tokens(get_reduce_summary_prompt(partials)) <= budget:
+            return partials
+        text = ' '.join(partials)
+    return partials
+
+def _reduce_request(partials):
+    """cached_completion / CompletionStream arguments for the reduce step."""
+    return dict(
+        kind="summary_reduce",
+        text="\n\n".join(partials),
+        model=SUMMARY_MODEL,
+        system_prompt=SUMMARIZATION_SYSTEM_PROMPT,
+        user_prompt=get_reduce_summary_prompt(partials),
+        temperature=0.7,
+        max_tokens=600
     )
 
 def summarize(text):
@@ -35,23 +109,66 @@ def summarize(text):
         return "⚠️ OpenRouter API Key missing. Please set OPENROUTER_API_KEY in sidebar."
     
     try:
-        response = client.chat.completions.create(
-            model="openai/gpt-4o", # OpenRouter model ID
-            messages=[
-                {"role": "system", "content": SUMMARIZATION_SYSTEM_PROMPT},
-                {"role": "user", "content": get_summary_prompt(text)}
-            ],
+        if needs_map_reduce(text):
+            partials = _map_summaries(client, text)
+            return cached_completion(client, **_reduce_request(partials))
+        
+        # Repeat requests for the same article are answered from the LLM cache
+        summary = cached_completion(
+            client,
+            "summary",
+            text,
+            model=SUMMARY_MODEL,
+            system_prompt=SUMMARIZATION_SYSTEM_PROMPT,
+            user_prompt=get_summary_prompt(text),
             temperature=0.7,
-            max_tokens=600,
-            extra_headers={
-                "HTTP-Referer": "http://localhost:8501", # Required by OpenRouter
-                "X-Title": "News Intelligence App",
-            }
+            max_tokens=600
         )
-        
-        summary = response.choices[0].message.content.strip()
         return summary
     
     except Exception as e:
         print(f"OpenAI Summarization error: {e}")
         return f"Error using OpenAI: {str(e)}"
+
+def summarize_stream(text):
+    """
+    Streaming variant of summarize(): returns an iterable of text chunks
+    (render with st.write_stream). After iteration, `.result` holds the
+    final summary and `.ttft_ms` / `.total_ms` the timings.
+    
+    For long articles the map step runs here (blocking) and only the final
+    reduce pass is streamed; the timings include the map step.
+    """
+    if not text or len(text.strip()) < 50:
+        return CompletionStream.static("Text too short to summarize.")
+    
+    client = get_openai_client()
+    if not client:
+        message = "⚠️ OpenRouter API Key missing. Please set OPENROUTER_API_KEY in sidebar."
+        return CompletionStream.static(message, error=message)
+    
+    if needs_map_reduce(text):
+        started = time.perf_counter()
+        try:
+            partials = _map_summaries(client, text)
+        except Exception as e:
+            print(f"OpenAI Summarization error: {e}")
+            return CompletionStream.static(f"Error using OpenAI: {str(e)}", error=e)
+        return CompletionStream(
+            client,
+            on_error=lambda e: f"Error using OpenAI: {str(e)}",
+            started=started,
+            **_reduce_request(partials)
+        )
+    
+    return CompletionStream(
+        client,
+        "summary",
+        text,
+        model=SUMMARY_MODEL,
+        system_prompt=SUMMARIZATION_SYSTEM_PROMPT,
+        user_prompt=get_summary_prompt(text),
+        on_error=lambda e: f"Error using OpenAI: {str(e)}",
+        temperature=0.7,
+        max_tokens=600
+    )
@@ -0,0 +1,186 @@
+"""
+Near-Duplicate Detection
+URL canonicalization + MinHash signatures with an LSH band index,
+used to collapse syndicated wire stories into a single story cluster.
+"""
+
+import hashlib
+import re
+import threading
+import numpy as np
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Query parameters that only track the click and never change the content
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid',
+    'ref', 'ref_src', 'referrer', 'cmpid', 'ito', 'ocid', 'smid', 'src',
+    'partner', 'share', 'amp', 'output', 'ns_mchannel', 'ns_source'
+}
+
+SHINGLE_SIZE = 2
+NUM_PERM = 128
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_rng = np.random.RandomState(1)  # Fixed seed: signatures must be stable across runs
+_PERMUTATIONS = (
+    _rng.randint(1, 1 << 32, size=NUM_PERM, dtype=np.uint64),
+    _rng.randint(0, 1 << 32, size=NUM_PERM, dtype=np.uint64),
+)
+
+_WORD_RE = re.compile(r'\w+', re.UNICODE)
+_TRUNCATION_RE = re.compile(r'\s*\[\+\d+ chars\]\s*$')
+
+
+def canonicalize_url(url):
+    """
+    Normalizes an article URL so the same story maps to the same string:
+    lowercases scheme/host, drops 'www.'/'m.'/'amp.' prefixes, fragments,
+    tracking parameters, AMP suffixes and trailing slashes.
+    """
+    if not url:
+        return ''
+
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+
+    host = (parts.hostname or '').lower()
+    for prefix in ('www.', 'm.', 'amp.'):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    path = re.sub(r'/+', '/', parts.path or '/')
+    path = re.sub(r'/amp/?$|\.amp$', '', path)
+    path = path.rstrip('/') or '/'
+
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith('utm_') and k.lower() not in TRACKING_PARAMS
+    )
+
+    return urlunsplit(('https', host, path, urlencode(query), ''))
+
+
+def article_id(canonical_url, title='', source=''):
+    """
+    Deterministic article ID derived from the canonical URL
+    (falls back to source + title for articles without a URL).
+    """
+    basis = canonical_url or f"{source}|{title}".lower()
+    return "article_" + hashlib.sha256(basis.encode('utf-8')).hexdigest()[:16]
+
+
+def content_fingerprint(text):
+    """SHA-256 of the whitespace/case-normalized text, ignoring NewsAPI truncation markers."""
+    normalized = ' '.join(_WORD_RE.findall(_TRUNCATION_RE.sub('', text or '').lower()))
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+def _shingles(text, size=SHINGLE_SIZE):
+    """Word n-gram shingles of the lowercased text."""
+    words = _WORD_RE.findall(_TRUNCATION_RE.sub('', text).lower())
+    if len(words) < size:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def minhash_signature(text, num_perm=NUM_PERM):
+    """
+    Computes a MinHash signature of the text's word shingles.
+    The fraction of equal positions in two signatures estimates their Jaccard similarity.
+    """
+    shingles = _shingles(text or '')
+    if not shingles:
+        return None
+
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=4).digest(), 'big')
+         for s in shingles),
+        dtype=np.uint64,
+        count=len(shingles)
+    )
+    a, b = _PERMUTATIONS[0][:num_perm], _PERMUTATIONS[1][:num_perm]
+    # (a*h + b) mod p for every permutation x shingle; a, h < 2^32 so a*h fits in uint64
+    permuted = ((hashes[None, :] * a[:, None]) % _MERSENNE_PRIME + b[:, None]) % _MERSENNE_PRIME
+    return permuted.min(axis=1)
+
+
+def estimate_similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of two MinHash signatures."""
+    if sig_a is None or sig_b is None:
+        return 0.0
+    return float(np.mean(sig_a == sig_b))
+
+
+class NearDuplicateIndex:
+    """
+    MinHash-LSH index for near-duplicate articles.
+
+    Signatures are split into `bands` bands of `num_perm // bands` rows; only
+    items sharing an identical band land in the same bucket and get compared,
+    so a lookup costs O(bucket size) instead of O(history size).
+
+    Args:
+        threshold: Minimum estimated Jaccard similarity to count as a near-duplicate
+        num_perm: Signature length
+        bands: Number of LSH bands (more bands = higher recall, more candidates)
+    """
+
+    def __init__(self, threshold=0.5, num_perm=NUM_PERM, bands=32):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.rows = max(1, num_perm // bands)
+        self.bands = num_perm // self.rows
+        self._tables = [dict() for _ in range(self.bands)]
+        self._signatures = {}  # cluster_id -> signature
+        self._urls = {}        # canonical URL -> cluster_id
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._signatures)
+
+    def _band_keys(self, signature):
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def _find(self, signature, canonical_url):
+        if canonical_url and canonical_url in self._urls:
+            return self._urls[canonical_url]
+        if signature is None:
+            return None
+
+        checked = set()
+        for table, key in zip(self._tables, self._band_keys(signature)):
+            for cluster_id in table.get(key, ()):
+                if cluster_id in checked:
+                    continue
+                checked.add(cluster_id)
+                if estimate_similarity(signature, self._signatures[cluster_id]) >= self.threshold:
+                    return cluster_id
+        return None
+
+    def add(self, cluster_id, text, canonical_url=''):
+        """
+        Registers an item unless it duplicates a known one.
+
+        Returns:
+            The cluster id of the matching existing item, or None if `cluster_id` was added.
+        """
+        signature = minhash_signature(text, self.num_perm)
+        with self._lock:
+            existing = self._find(signature, canonical_url)
+            if existing is not None:
+                if canonical_url:
+                    self._urls.setdefault(canonical_url, existing)
+                return existing
+
+            self._signatures[cluster_id] = signature
+            if canonical_url:
+                self._urls[canonical_url] = cluster_id
+            if signature is not None:
+                for table, key in zip(self._tables, self._band_keys(signature)):
+                    table.setdefault(key, []).append(cluster_id)
+            return None
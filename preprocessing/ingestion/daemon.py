@@ -0,0 +1,120 @@
+"""
+Background Ingestion Daemon
+Polls NewsAPI for configured regions, categories and queries on a jittered
+schedule, classifies new articles and writes them to the local article repository
+so the dashboard can render without waiting on the network.
+
+Usage:
+    python -m preprocessing.ingestion.daemon --regions in,us --queries "RBI,IPL" --interval 600
+"""
+
+import argparse
+import os
+import random
+import signal
+import sys
+import threading
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from dotenv import load_dotenv
+
+from preprocessing.deduplication import NearDuplicateIndex
+from preprocessing.ingestion.news_fetcher import fetch_news_feed
+from storage.article_repository import upsert_articles, touch_feed, DEFAULT_DB_PATH, DEFAULT_FEED
+
+def _split(value):
+    return [item.strip() for item in (value or '').split(',') if item.strip()]
+
+def build_specs(regions, categories, queries, page_size=50):
+    """Builds fetch_news_feed specs: one per region (x category) plus one per query."""
+    specs = []
+    for region in regions:
+        if categories:
+            specs.extend({'country': region, 'category': c, 'page_size': page_size} for c in categories)
+        else:
+            specs.append({'country': region, 'page_size': page_size})
+    specs.extend({'query': q, 'page_size': page_size} for q in queries)
+    return specs
+
+def run_cycle(specs, api_key, db_path, dedup_index, feed_size=None):
+    """
+    Fetches every spec once and stores the results. Returns the number of new articles.
+
+    Stories already in `dedup_index` are skipped, so new ones are appended to
+    the default feed, which is then trimmed to its newest `feed_size` entries.
+    The feed is marked fresh even when nothing new came in, so the dashboard
+    keeps using it.
+    """
+    # Always go upstream: the response cache would otherwise replay the last poll
+    articles = fetch_news_feed(specs, api_key=api_key, dedup_index=dedup_index, use_cache=False)
+    if not articles:
+        touch_feed(DEFAULT_FEED, db_path=db_path)
+        return 0
+    return upsert_articles(articles, feed=DEFAULT_FEED, replace=False, max_items=feed_size, db_path=db_path)
+
+def next_delay(interval, jitter):
+    """Interval randomized by +/- `jitter` (fraction) so instances don't poll in lockstep."""
+    return max(1.0, interval * (1 + random.uniform(-jitter, jitter)))
+
+def main(argv=None):
+    env_path = os.path.join(os.path.dirname(__file__), '..', '..', '.env')
+    load_dotenv(dotenv_path=env_path)
+
+    parser = argparse.ArgumentParser(description="Background NewsAPI ingestion daemon")
+    parser.add_argument('--regions', default=os.getenv('INGEST_REGIONS', 'in'),
+                        help="Comma-separated country codes (default: in)")
+    parser.add_argument('--categories', default=os.getenv('INGEST_CATEGORIES', ''),
+                        help="Comma-separated NewsAPI categories per region")
+    parser.add_argument('--queries', default=os.getenv('INGEST_QUERIES', ''),
+                        help="Comma-separated saved search queries")
+    parser.add_argument('--interval', type=float, default=float(os.getenv('INGEST_INTERVAL', 600)),
+                        help="Seconds between polls (default: 600)")
+    parser.add_argument('--jitter', type=float, default=0.1,
+                        help="Random +/- fraction applied to the interval (default: 0.1)")
+    parser.add_argument('--dedup-reset-cycles', type=int, default=int(os.getenv('INGEST_DEDUP_RESET_CYCLES', 24)),
+                        help="Start a fresh near-duplicate index every N cycles to bound memory (default: 24)")
+    parser.add_argument('--feed-size', type=int, default=int(os.getenv('INGEST_FEED_SIZE', 300)),
+                        help="Articles kept in the default feed, newest first (default: 300)")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="Article database path")
+    parser.add_argument('--once', action='store_true', help="Run a single cycle and exit")
+    args = parser.parse_args(argv)
+
+    api_key = os.getenv('NEWSAPI_KEY', '').strip().strip('"').strip("'")
+    if not api_key:
+        print("⚠️ NEWSAPI_KEY is not set!")
+        return 1
+
+    specs = build_specs(_split(args.regions), _split(args.categories), _split(args.queries))
+    if not specs:
+        print("⚠️ Nothing to ingest: configure --regions and/or --queries")
+        return 1
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+    dedup_index = None
+    cycle = 0
+    print(f"📡 Ingesting {len(specs)} feeds into {args.db}")
+    while not stop.is_set():
+        started = time.time()
+        # Stories are remembered across cycles (so repeats are skipped) but not forever
+        if dedup_index is None or cycle % max(1, args.dedup_reset_cycles) == 0:
+            dedup_index = NearDuplicateIndex()
+        cycle += 1
+        try:
+            new_count = run_cycle(specs, api_key, args.db, dedup_index, args.feed_size)
+            print(f"✅ Stored {new_count} new articles in {time.time() - started:.1f}s")
+        except Exception as e:
+            print(f"Ingestion cycle failed: {e}")
+
+        if args.once:
+            break
+        stop.wait(next_delay(args.interval, args.jitter))
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""
+Full-Text Prefetcher
+Scrapes full article bodies (newspaper3k) in a background thread pool so
+opening an article is served from a disk cache instead of a 2-8s download.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from newspaper import Article as NewsArticle, Config as NewsConfig
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+CACHE_DIR = os.getenv('FULLTEXT_CACHE_DIR', os.path.join(PROJECT_ROOT, 'data', 'fulltext'))
+MAX_WORKERS = int(os.getenv('FULLTEXT_WORKERS', 8))
+PER_DOMAIN_LIMIT = int(os.getenv('FULLTEXT_PER_DOMAIN', 2))
+REQUEST_TIMEOUT = float(os.getenv('FULLTEXT_TIMEOUT', 8))
+
+# Lines that are page chrome rather than article text
+JUNK_PATTERNS = [
+    'Share', 'Save', 'Getty Images', 'Share Save',
+    'Related Topics', 'More on this story',
+    'Sign up for', 'Subscribe to', 'Follow us on'
+]
+
+def needs_full_text(article):
+    """True when the NewsAPI content is only a truncated preview."""
+    preview = article.get('content') or article.get('description') or ''
+    preview = preview.replace('[+', '').replace(' chars]', '').strip()
+    return len(preview) < 500 or '[+' in str(article.get('content', ''))
+
+def clean_scraped_text(text):
+    """Drops empty lines, short junk lines and leading metadata from scraped text."""
+    cleaned_lines = []
+    for line in text.split('\n'):
+        line = line.strip()
+        # Skip empty lines
+        if not line:
+            continue
+        # Skip lines that are just junk
+        if any(junk in line for junk in JUNK_PATTERNS) and len(line) < 50:
+            continue
+        # Skip very short lines at the start (likely metadata)
+        if len(cleaned_lines) < 3 and len(line) < 30:
+            continue
+        cleaned_lines.append(line)
+    return '\n\n'.join(cleaned_lines)
+
+def scrape_full_text(url, timeout=REQUEST_TIMEOUT):
+    """Downloads and parses an article page. Returns cleaned text ('' if nothing usable)."""
+    config = NewsConfig()
+    config.request_timeout = timeout
+    config.fetch_images = False
+    config.memoize_articles = False
+
+    news_article = NewsArticle(url, config=config)
+    news_article.download()
+    news_article.parse()
+    return clean_scraped_text(news_article.text or '')
+
+def _cache_path(article_id):
+    return os.path.join(CACHE_DIR, f"{article_id}.txt")
+
+def get_cached_full_text(article_id):
+    """Returns the cached full text for an article ID, or None."""
+    try:
+        with open(_cache_path(article_id), 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+def _store_full_text(article_id, text):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _cache_path(article_id)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+class FullTextPrefetcher:
+    """
+    Bounded thread pool that scrapes article bodies into the disk cache.
+
+    At most `per_domain` downloads run against the same host at once, so a
+    feed dominated by one publisher doesn't hammer it (or get us blocked).
+    """
+
+    def __init__(self, max_workers=MAX_WORKERS, per_domain=PER_DOMAIN_LIMIT, timeout=REQUEST_TIMEOUT):
+        self.per_domain = per_domain
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='fulltext')
+        self._lock = threading.Lock()
+        self._domain_slots = {}
+        self._pending = set()
+        self._failed = set()
+
+    def _domain_slot(self, url):
+        domain = urlsplit(url).netloc.lower()
+        with self._lock:
+            slot = self._domain_slots.get(domain)
+            if slot is None:
+                slot = self._domain_slots[domain] = threading.BoundedSemaphore(self.per_domain)
+            return slot
+
+    def fetch(self, article):
+        """
+        Returns the full text for `article`, scraping synchronously on a cache miss.
+        Returns None if the page could not be scraped.
+        """
+        cached = get_cached_full_text(article['id'])
+        if cached is not None:
+            return cached
+
+        with self._domain_slot(article['url']):
+            text = scrape_full_text(article['url'], timeout=self.timeout)
+        if text:
+            _store_full_text(article['id'], text)
+            return text
+        return None
+
+    def _prefetch_one(self, article):
+        try:
+            if self.fetch(article) is None:
+                self._failed.add(article['id'])
+        except Exception as e:
+            self._failed.add(article['id'])
+            print(f"Prefetch failed for {article['url']}: {e}")
+        finally:
+            with self._lock:
+                self._pending.discard(article['id'])
+
+    def prefetch(self, articles, top_n=10):
+        """Queues background scrapes for the first `top_n` articles that need full text."""
+        queued = 0
+        for article in articles[:top_n]:
+            if not article.get('url') or not needs_full_text(article):
+                continue
+            article_id = article['id']
+            with self._lock:
+                if article_id in self._pending or article_id in self._failed:
+                    continue
+                if get_cached_full_text(article_id) is not None:
+                    continue
+                self._pending.add(article_id)
+            self._executor.submit(self._prefetch_one, dict(article))
+            queued += 1
+        return queued
+
+_prefetcher = None
+_prefetcher_lock = threading.Lock()
+
+def get_prefetcher():
+    """Process-wide prefetcher shared by all sessions."""
+    global _prefetcher
+    with _prefetcher_lock:
+        if _prefetcher is None:
+            _prefetcher = FullTextPrefetcher()
+        return _prefetcher
@@ -5,16 +5,166 @@ Fetches news from NewsAPI using the official library
 
 from newsapi import NewsApiClient
 import pandas as pd
-from datetime import datetime
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import threading
+import time
 import sys
 import os
 
 # Add parent directory to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from classification.topic_classifier import classify_topic
+from classification.topic_classifier import classify_topics
+from preprocessing.deduplication import (
+    NearDuplicateIndex, canonicalize_url, article_id, content_fingerprint
+)
+from utils.cache import TTLCache
+from utils.singleflight import SingleFlight
+from utils.replay import call_with_replay
 
-__all__ = ['fetch_news', 'fetch_default_news', 'search_news_by_query']
+__all__ = ['fetch_news', 'fetch_default_news', 'search_news_by_query',
+           'fetch_news_feed', 'iter_news', 'get_cache_stats', 'clear_cache',
+           'get_fetch_latency_stats']
+
+# HTTP layer: one pooled keep-alive session shared by every NewsApiClient
+NEWSAPI_ORIGIN = 'https://newsapi.org'
+NEWSAPI_BASE_URL = os.getenv('NEWSAPI_BASE_URL') or None  # e.g. a local stub server
+CONNECT_TIMEOUT = float(os.getenv('NEWSAPI_CONNECT_TIMEOUT', 3.05))
+READ_TIMEOUT = float(os.getenv('NEWSAPI_READ_TIMEOUT', 10))
+MAX_RETRIES = int(os.getenv('NEWSAPI_MAX_RETRIES', 3))
+RETRY_BACKOFF = float(os.getenv('NEWSAPI_RETRY_BACKOFF', 0.5))
+
+# Process-wide NewsAPI response cache (shared by all Streamlit sessions)
+CACHE_TTL_SECONDS = float(os.getenv('NEWSAPI_CACHE_TTL', 900))
+CACHE_MAX_ENTRIES = int(os.getenv('NEWSAPI_CACHE_SIZE', 256))
+CACHE_PATH = os.getenv('NEWSAPI_CACHE_PATH') or None
+
+_response_cache = TTLCache(
+    max_entries=CACHE_MAX_ENTRIES,
+    ttl=CACHE_TTL_SECONDS,
+    path=CACHE_PATH
+)
+
+# Coalesces identical NewsAPI requests issued concurrently by different sessions
+_inflight_requests = SingleFlight()
+
+# Latency of upstream fetches (including retries), in seconds
+_fetch_latencies = deque(maxlen=1000)
+
+class _NewsApiSession(requests.Session):
+    """
+    Session that enforces our connect/read timeouts (NewsApiClient hardcodes 30s)
+    and optionally redirects requests to NEWSAPI_BASE_URL.
+    """
+
+    def request(self, method, url, *args, **kwargs):
+        kwargs['timeout'] = (CONNECT_TIMEOUT, READ_TIMEOUT)
+        if NEWSAPI_BASE_URL and url.startswith(NEWSAPI_ORIGIN):
+            url = NEWSAPI_BASE_URL.rstrip('/') + url[len(NEWSAPI_ORIGIN):]
+        return super().request(method, url, *args, **kwargs)
+
+def _build_session():
+    """Keep-alive session with bounded exponential backoff on 429/5xx (honours Retry-After)."""
+    retry = Retry(
+        total=MAX_RETRIES,
+        connect=MAX_RETRIES,
+        read=MAX_RETRIES,
+        status=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET']),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+    session = _NewsApiSession()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+_session = _build_session()
+_clients = {}
+_clients_lock = threading.Lock()
+
+def _get_client(api_key):
+    """Returns the long-lived NewsApiClient for this key (all share one session)."""
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = NewsApiClient(api_key=api_key, session=_session)
+            _clients[api_key] = client
+        return client
+
+def get_fetch_latency_stats():
+    """Returns p50/p99 latency (ms) of recent upstream NewsAPI fetches."""
+    samples = sorted(_fetch_latencies)
+    if not samples:
+        return {"count": 0, "p50_ms": 0.0, "p99_ms": 0.0}
+
+    def percentile(p):
+        return samples[min(len(samples) - 1, int(p * len(samples)))] * 1000
+
+    return {
+        "count": len(samples),
+        "p50_ms": percentile(0.50),
+        "p99_ms": percentile(0.99)
+    }
+
+def get_cache_stats():
+    """Returns hit/miss counters of the NewsAPI response cache."""
+    stats = _response_cache.stats()
+    stats['coalesced'] = _inflight_requests.shared
+    return stats
+
+def clear_cache():
+    """Empties the NewsAPI response cache."""
+    _response_cache.clear()
+
+def _call_newsapi(api_key, endpoint, use_cache=True, **params):
+    """
+    Calls a NewsAPI endpoint ('everything' or 'top_headlines') through the
+    shared response cache. Concurrent identical requests share a single
+    upstream call. Only successful responses are cached.
+
+    With use_cache=False the cache is not read (the fresh response still
+    replaces the cached one), e.g. for scheduled polls.
+    """
+    cache_key = (endpoint,) + tuple(sorted(params.items()))
+    if use_cache:
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    # Forced-fresh calls must not join a caller that may answer from the cache
+    return _inflight_requests.do((cache_key, use_cache), _fetch_upstream, api_key, endpoint, cache_key, params, use_cache)
+
+def _fetch_upstream(api_key, endpoint, cache_key, params, use_cache=True):
+    """Performs the actual NewsAPI request (runs once per in-flight key)."""
+    # A previous leader may have filled the cache while we were queued
+    # (peek: this call's lookup was already counted as a miss)
+    if use_cache:
+        cached = _response_cache.peek(cache_key)
+        if cached is not None:
+            return cached
+
+    newsapi = _get_client(api_key)
+    request_fn = newsapi.get_top_headlines if endpoint == 'top_headlines' else newsapi.get_everything
+    start = time.perf_counter()
+    try:
+        # Recorded/replayed when REPLAY_MODE is set (offline benchmarking)
+        response = call_with_replay(
+            'newsapi', {'endpoint': endpoint, **params}, lambda: request_fn(**params)
+        )
+    finally:
+        _fetch_latencies.append(time.perf_counter() - start)
+
+    if response.get('status') == 'ok':
+        _response_cache.set(cache_key, response)
+    return response
 
 def fetch_news(query="India", api_key=None, language='en', page_size=20):
     """
@@ -27,10 +177,10 @@ def fetch_news(query="India", api_key=None, language='en', page_size=20):
     api_key = str(api_key).strip().strip('"').strip("'")
     
     try:
-        newsapi = NewsApiClient(api_key=api_key)
-        
         # Use 'everything' endpoint
-        response = newsapi.get_everything(
+        response = _call_newsapi(
+            api_key,
+            'everything',
             q=query,
             language=language,
             page_size=min(page_size, 100),
@@ -53,6 +203,64 @@ def search_news_by_query(query, api_key=None, language='en', page_size=20):
     """
     return fetch_news(query, api_key, language, page_size)
 
+def iter_news(query="India", api_key=None, language='en', page_size=20, max_pages=None):
+    """
+    Lazily walks NewsAPI 'everything' result pages and yields enriched articles.
+
+    Each page is only requested once the consumer has used up the previous one,
+    so the first articles are available after a single round-trip regardless of
+    how many results the query has in total.
+
+    Args:
+        query: Search query
+        api_key: NewsAPI key
+        language: Article language
+        page_size: Articles per NewsAPI page (max 100)
+        max_pages: Optional limit on the number of pages fetched
+
+    Yields:
+        dict: Enriched article
+    """
+    if not api_key:
+        print("⚠️ No API key provided!")
+        return
+
+    api_key = str(api_key).strip().strip('"').strip("'")
+    page_size = max(1, min(page_size, 100))
+
+    # Shared across pages so a story repeated on a later page is not yielded twice
+    dedup_index = NearDuplicateIndex()
+    page = 1
+    fetched = 0
+    while max_pages is None or page <= max_pages:
+        try:
+            response = _call_newsapi(
+                api_key,
+                'everything',
+                q=query,
+                language=language,
+                page_size=page_size,
+                page=page,
+                sort_by='relevancy'
+            )
+        except Exception as e:
+            # e.g. 'maximumResultsReached' on plans with a result cap
+            print(f"Stopping pagination at page {page}: {e}")
+            return
+
+        if response.get('status') != 'ok':
+            print(f"NewsAPI Error: {response.get('message', 'Unknown error')}")
+            return
+
+        articles = response.get('articles', [])
+        yield from _process_articles(articles, dedup_index=dedup_index)
+        fetched += len(articles)
+
+        total_results = response.get('totalResults', 0)
+        if len(articles) < page_size or fetched >= total_results:
+            return
+        page += 1
+
 def fetch_default_news(api_key=None):
     """
     Fetches default news (India Headlines) with fallback.
@@ -65,10 +273,10 @@ def fetch_default_news(api_key=None):
     print(f"🔑 Using API key: {api_key[:10]}...")
     
     try:
-        newsapi = NewsApiClient(api_key=api_key)
-        
         # Attempt 1: Top Headlines (India)
-        response = newsapi.get_top_headlines(
+        response = _call_newsapi(
+            api_key,
+            'top_headlines',
             country='in',
             language='en',
             page_size=50
@@ -79,7 +287,9 @@ def fetch_default_news(api_key=None):
         # Attempt 2: Fallback to Everything (India Query)
         if not articles:
             print("⚠️ Top headlines empty, falling back to Everything endpoint...")
-            response = newsapi.get_everything(
+            response = _call_newsapi(
+                api_key,
+                'everything',
                 q='India',
                 language='en',
                 page_size=50,
@@ -93,31 +303,162 @@ def fetch_default_news(api_key=None):
         print(f"Error fetching default news: {e}")
         return []
 
-def _process_articles(articles):
-    """Helper to process raw articles into our format"""
+def _feed_request(spec):
+    """
+    Translates a feed spec into (endpoint, params).
+
+    Specs with a country/category use 'top_headlines' (optionally filtered by
+    'query'); query-only specs use the 'everything' endpoint.
+    """
+    params = {
+        'language': spec.get('language', 'en'),
+        'page_size': min(spec.get('page_size', 50), 100)
+    }
+
+    if spec.get('country') or spec.get('category'):
+        if spec.get('country'):
+            params['country'] = spec['country']
+        if spec.get('category'):
+            params['category'] = spec['category']
+        if spec.get('query'):
+            params['q'] = spec['query']
+        return 'top_headlines', params
+
+    params['q'] = spec.get('query') or 'India'
+    params['sort_by'] = spec.get('sort_by', 'publishedAt')
+    return 'everything', params
+
+def fetch_news_feed(specs, api_key=None, max_workers=8, timeout=15.0, dedup_index=None, use_cache=True):
+    """
+    Fetches several NewsAPI requests in parallel and merges them into one feed.
+
+    Args:
+        specs: List of dicts, e.g. {'country': 'in'}, {'country': 'us', 'category': 'business'}
+               or {'query': 'RBI'}. Optional keys: language, page_size, sort_by.
+        api_key: NewsAPI key
+        max_workers: Upper bound on concurrent NewsAPI requests
+        timeout: Seconds a single request may run before it is dropped from the feed
+        dedup_index: Optional long-lived NearDuplicateIndex (drops stories seen in earlier feeds)
+        use_cache: False to always go upstream instead of reading the response cache
+
+    Returns:
+        list: De-duplicated enriched articles, newest first
+    """
+    if not api_key:
+        print("⚠️ No API key provided for feed!")
+        return []
+    if not specs:
+        return []
+
+    api_key = str(api_key).strip().strip('"').strip("'")
+
+    started = {}
+
+    def run(idx, endpoint, params):
+        started[idx] = time.monotonic()
+        return _call_newsapi(api_key, endpoint, use_cache=use_cache, **params)
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(specs))))
+    futures = {}
+    for idx, spec in enumerate(specs):
+        endpoint, params = _feed_request(spec)
+        futures[executor.submit(run, idx, endpoint, params)] = idx
+
+    raw_articles = []
+    pending = set(futures)
+    while pending:
+        # Sleep until the next request could possibly time out
+        now = time.monotonic()
+        deadlines = [started[futures[f]] + timeout for f in pending if futures[f] in started]
+        wait_for = max(0.0, min(deadlines) - now) if deadlines else timeout
+        done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            try:
+                response = future.result()
+            except Exception as e:
+                print(f"Feed request {specs[futures[future]]} failed: {e}")
+                continue
+            if response.get('status') != 'ok':
+                print(f"NewsAPI Error: {response.get('message', 'Unknown error')}")
+                continue
+            raw_articles.extend(response.get('articles', []))
+
+        now = time.monotonic()
+        expired = {f for f in pending
+                   if futures[f] in started and now - started[futures[f]] >= timeout}
+        for future in expired:
+            print(f"⚠️ Feed request {specs[futures[future]]} timed out after {timeout}s, skipping")
+        pending -= expired
+
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    # Newest first (ISO-8601 timestamps sort lexically); duplicates are folded in _process_articles
+    raw_articles.sort(key=lambda a: a.get('publishedAt') or '', reverse=True)
+
+    return _process_articles(raw_articles, dedup_index=dedup_index)
+
+def _process_articles(articles, dedup_index=None):
+    """
+    Helper to process raw articles into our format.
+
+    Article IDs are derived from the canonical URL, so the same story keeps
+    the same ID across refreshes, sessions and restarts; 'content_hash'
+    changes whenever the text itself changes.
+
+    Exact (canonical URL) and near-duplicate (MinHash-LSH over title+content)
+    copies are folded into the first article of their story cluster before
+    classification, so syndicated wire stories are only processed once.
+    Pass a long-lived `dedup_index` to also drop stories seen in earlier calls.
+    """
     if not articles:
         return []
-        
+
+    index = dedup_index if dedup_index is not None else NearDuplicateIndex()
     enriched_articles = []
-    for idx, article in enumerate(articles):
+    texts = []
+    clusters = {}  # article id -> enriched representative in this batch
+    for article in articles:
         full_text = article.get('content') or article.get('description') or ''
-        # Auto-classify topic
-        topic_result = classify_topic(article.get('title', '') + ' ' + full_text)
-        
+        canonical_url = canonicalize_url(article.get('url', ''))
+        source_name = (article.get('source') or {}).get('name', 'Unknown')
+        text = (article.get('title') or '') + ' ' + full_text
+
+        stable_id = article_id(canonical_url, article.get('title', ''), source_name)
+        existing = index.add(stable_id, text, canonical_url)
+        if existing is not None:
+            representative = clusters.get(existing)
+            if representative is not None:
+                representative['duplicates'].append({
+                    'title': article.get('title', 'No Title'),
+                    'url': article.get('url', ''),
+                    'source': source_name
+                })
+            continue
+
         enriched_article = {
-            'id': f"article_{idx}_{datetime.now().timestamp()}",
+            'id': stable_id,
+            'content_hash': content_fingerprint(text),
             'title': article.get('title', 'No Title'),
             'description': article.get('description', ''),
             'content': full_text,
             'url': article.get('url', ''),
-            'source': article.get('source', {}).get('name', 'Unknown'),
+            'canonical_url': canonical_url,
+            'source': source_name,
             'published_at': article.get('publishedAt', ''),
             'image_url': article.get('urlToImage', ''),
-            'topic': topic_result.get('label', 'General'),
+            'topic': 'General',
+            'duplicates': [],
             'summary': None,
             'sentiment': None,
             'bias': None
         }
+        clusters[stable_id] = enriched_article
         enriched_articles.append(enriched_article)
+        texts.append(text)
+
+    # Auto-classify topics for the whole batch at once
+    for enriched_article, topic_result in zip(enriched_articles, classify_topics(texts)):
+        enriched_article['topic'] = topic_result.get('label', 'General')
     
     return enriched_articles
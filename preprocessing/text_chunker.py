@@ -0,0 +1,64 @@
+"""
+Token-Aware Text Chunker
+Splits cleaned article text on sentence boundaries into chunks that fit a
+token budget, so long articles can be summarized piece by piece.
+
+Token counts are estimated (~4 characters per token for English with GPT
+tokenizers); budgets should leave some headroom for that.
+"""
+
+import re
+
+CHARS_PER_TOKEN = 4
+
+# Sentence end: . ! ? (optionally followed by a closing quote / bracket) then whitespace.
+# Both ends are lookarounds, so splitting only removes the whitespace.
+_SENTENCE_END_RE = re.compile(r'(?:(?<=[.!?])|(?<=[.!?]["\')]))\s+(?=["\'(]?[A-Z0-9])')
+
+def estimate_tokens(text):
+    """Approximate token count of `text`."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN if text else 0
+
+def split_sentences(text):
+    """Splits text into sentences (no NLTK data needed)."""
+    return [s.strip() for s in _SENTENCE_END_RE.split(text or '') if s.strip()]
+
+def _split_words(sentence, max_tokens):
+    """Hard-wraps a single over-long sentence at word boundaries."""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    pieces, current = [], ''
+    for word in sentence.split():
+        if current and len(current) + 1 + len(word) > max_chars:
+            pieces.append(current)
+            current = word
+        else:
+            current = f"{current} {word}" if current else word
+    if current:
+        pieces.append(current)
+    return pieces
+
+def chunk_text(text, max_tokens):
+    """
+    Groups consecutive sentences into chunks of at most `max_tokens`
+    (estimated). Sentences longer than the budget are split at word
+    boundaries.
+
+    Args:
+        text: Cleaned text
+        max_tokens: Token budget per chunk
+
+    Returns:
+        list[str]: Chunks in document order (empty for empty text)
+    """
+    chunks, current, current_tokens = [], [], 0
+    for sentence in split_sentences(text):
+        for piece in _split_words(sentence, max_tokens) if estimate_tokens(sentence) > max_tokens else [sentence]:
+            tokens = estimate_tokens(piece) + 1  # + joining space
+            if current and current_tokens + tokens > max_tokens:
+                chunks.append(' '.join(current))
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += tokens
+    if current:
+        chunks.append(' '.join(current))
+    return chunks
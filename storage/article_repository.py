@@ -0,0 +1,270 @@
+"""
+Article Repository
+Persistent SQLite (WAL mode) store for enriched articles, shared by the
+ingestion daemon, every dashboard session and the analytics page.
+
+Articles are upserted by their stable ID. Named feeds ('default' for the
+ingestion daemon, 'live' for headlines the dashboard fetched itself,
+'search:<query>') record which articles belong to a feed and in what order,
+so pages can query one feed with filters and pagination in SQL.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+DEFAULT_DB_PATH = os.getenv('ARTICLE_DB_PATH', os.path.join(PROJECT_ROOT, 'data', 'articles.db'))
+
+DEFAULT_FEED = 'default'
+LIVE_FEED = 'live'
+
+# Columns stored as JSON text
+_JSON_FIELDS = ('duplicates', 'sentiment', 'bias')
+_ANALYSIS_FIELDS = ('summary', 'sentiment', 'bias')
+_COLUMNS = (
+    'id', 'content_hash', 'title', 'description', 'content', 'url', 'canonical_url',
+    'source', 'published_at', 'image_url', 'topic', 'duplicates',
+    'summary', 'sentiment', 'bias'
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id            TEXT PRIMARY KEY,
+    content_hash  TEXT,
+    title         TEXT,
+    description   TEXT,
+    content       TEXT,
+    url           TEXT,
+    canonical_url TEXT,
+    source        TEXT,
+    published_at  TEXT,
+    image_url     TEXT,
+    topic         TEXT,
+    duplicates    TEXT,
+    summary       TEXT,
+    sentiment     TEXT,
+    bias          TEXT,
+    ingested_at   REAL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_topic_published ON articles(topic, published_at DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source);
+CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published_at DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_content_hash ON articles(content_hash);
+
+CREATE TABLE IF NOT EXISTS feed_items (
+    feed       TEXT NOT NULL,
+    article_id TEXT NOT NULL,
+    rank       INTEGER NOT NULL,
+    PRIMARY KEY (feed, article_id)
+);
+CREATE INDEX IF NOT EXISTS idx_feed_items_rank ON feed_items(feed, rank);
+
+CREATE TABLE IF NOT EXISTS feeds (
+    feed       TEXT PRIMARY KEY,
+    updated_at REAL NOT NULL
+);
+"""
+
+_UPSERT_SQL = f"""
+INSERT INTO articles ({', '.join(_COLUMNS)}, ingested_at)
+VALUES ({', '.join('?' for _ in _COLUMNS)}, ?)
+ON CONFLICT(id) DO UPDATE SET
+    {', '.join(f'{c} = excluded.{c}' for c in _COLUMNS if c not in ('id',) + _ANALYSIS_FIELDS)},
+    {', '.join(f'{c} = COALESCE(excluded.{c}, articles.{c})' for c in _ANALYSIS_FIELDS)}
+"""
+
+_local = threading.local()
+_init_lock = threading.Lock()
+_initialized = set()
+
+def get_connection(db_path=DEFAULT_DB_PATH):
+    """Returns this thread's connection to `db_path`, creating the schema on first use."""
+    connections = getattr(_local, 'connections', None)
+    if connections is None:
+        connections = _local.connections = {}
+
+    conn = connections.get(db_path)
+    if conn is None:
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        conn = sqlite3.connect(db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")  # Readers never block the writer
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with _init_lock:
+            if db_path not in _initialized:
+                conn.executescript(_SCHEMA)
+                _initialized.add(db_path)
+        connections[db_path] = conn
+    return conn
+
+def _to_row(article, now):
+    values = []
+    for column in _COLUMNS:
+        value = article.get(column)
+        if column in _JSON_FIELDS and value is not None:
+            value = json.dumps(value)
+        values.append(value)
+    values.append(now)
+    return values
+
+def _from_row(row):
+    article = dict(row)
+    article.pop('ingested_at', None)
+    article.pop('rank', None)
+    for field in _JSON_FIELDS:
+        if article.get(field):
+            try:
+                article[field] = json.loads(article[field])
+            except ValueError:
+                pass
+    if article.get('duplicates') is None:
+        article['duplicates'] = []
+    return article
+
+def upsert_articles(articles, feed=None, replace=True, max_items=None, db_path=DEFAULT_DB_PATH):
+    """
+    Bulk-inserts articles (updating existing IDs, keeping earlier analysis results).
+
+    Args:
+        articles: Enriched article dicts
+        feed: Optional feed name the articles belong to
+        replace: Replace the feed's contents (True) or append after its last item (False)
+        max_items: Keep only the feed's newest `max_items` entries (the articles
+                   themselves stay stored), so appended feeds do not grow forever
+
+    Returns:
+        int: Number of articles that were not stored before
+    """
+    if not articles:
+        return 0
+
+    conn = get_connection(db_path)
+    now = time.time()
+    ids = [a['id'] for a in articles]
+
+    with conn:
+        placeholders = ','.join('?' for _ in ids)
+        known = {row[0] for row in conn.execute(
+            f"SELECT id FROM articles WHERE id IN ({placeholders})", ids)}
+        conn.executemany(_UPSERT_SQL, [_to_row(a, now) for a in articles])
+
+        if feed:
+            if replace:
+                conn.execute("DELETE FROM feed_items WHERE feed = ?", (feed,))
+                start = 0
+            else:
+                start = conn.execute(
+                    "SELECT COALESCE(MAX(rank) + 1, 0) FROM feed_items WHERE feed = ?", (feed,)
+                ).fetchone()[0]
+            conn.executemany(
+                "INSERT OR IGNORE INTO feed_items (feed, article_id, rank) VALUES (?, ?, ?)",
+                [(feed, article_id, start + i) for i, article_id in enumerate(ids)]
+            )
+            if max_items is not None:
+                conn.execute(
+                    "DELETE FROM feed_items WHERE feed = ? AND article_id NOT IN "
+                    "(SELECT article_id FROM feed_items WHERE feed = ? ORDER BY rank DESC LIMIT ?)",
+                    (feed, feed, max_items)
+                )
+            _touch(conn, feed, now)
+
+    return len(set(ids) - known)
+
+def _touch(conn, feed, now):
+    conn.execute(
+        "INSERT INTO feeds (feed, updated_at) VALUES (?, ?) "
+        "ON CONFLICT(feed) DO UPDATE SET updated_at = excluded.updated_at",
+        (feed, now)
+    )
+
+def touch_feed(feed, db_path=DEFAULT_DB_PATH):
+    """Marks `feed` as up to date without changing its contents."""
+    conn = get_connection(db_path)
+    with conn:
+        _touch(conn, feed, time.time())
+
+def update_analysis(article_id, db_path=DEFAULT_DB_PATH, **fields):
+    """Stores analysis results (summary / sentiment / bias) for an article."""
+    fields = {k: v for k, v in fields.items() if k in _ANALYSIS_FIELDS}
+    if not fields:
+        return
+    assignments = ', '.join(f"{k} = ?" for k in fields)
+    values = [json.dumps(v) if k in _JSON_FIELDS and v is not None else v for k, v in fields.items()]
+    conn = get_connection(db_path)
+    with conn:
+        conn.execute(f"UPDATE articles SET {assignments} WHERE id = ?", values + [article_id])
+
+def _where(feed, topic, source, has_image, require_text):
+    clauses, params = [], []
+    if feed:
+        clauses.append("f.feed = ?")
+        params.append(feed)
+    if topic:
+        clauses.append("a.topic = ?")
+        params.append(topic)
+    if source:
+        clauses.append("a.source = ?")
+        params.append(source)
+    if has_image:
+        clauses.append("COALESCE(a.image_url, '') != ''")
+    if require_text:
+        clauses.append("(COALESCE(a.description, '') != '' OR COALESCE(a.content, '') != '')")
+    join = "JOIN feed_items f ON f.article_id = a.id" if feed else ""
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return join, where, params
+
+def query_articles(feed=None, topic=None, source=None, has_image=False, require_text=False,
+                   order='rank', limit=50, offset=0, db_path=DEFAULT_DB_PATH):
+    """
+    Returns articles matching the filters.
+
+    Args:
+        feed: Restrict to a named feed
+        topic / source: Exact-match filters
+        has_image: Only articles with an image URL
+        require_text: Only articles with a description or content
+        order: 'rank' (feed order) or 'recent' (published_at, newest first)
+        limit / offset: Pagination (limit=None returns everything)
+
+    Returns:
+        list: Article dicts
+    """
+    join, where, params = _where(feed, topic, source, has_image, require_text)
+    order_by = "f.rank" if feed and order == 'rank' else "a.published_at DESC"
+    sql = f"SELECT a.* FROM articles a {join} {where} ORDER BY {order_by}"
+    if limit is not None:
+        sql += " LIMIT ? OFFSET ?"
+        params += [limit, offset]
+    return [_from_row(row) for row in get_connection(db_path).execute(sql, params)]
+
+def count_articles(feed=None, topic=None, source=None, require_text=False, db_path=DEFAULT_DB_PATH):
+    """Counts articles matching the filters."""
+    join, where, params = _where(feed, topic, source, False, require_text)
+    sql = f"SELECT COUNT(*) FROM articles a {join} {where}"
+    return get_connection(db_path).execute(sql, params).fetchone()[0]
+
+def count_by(field, feed=None, require_text=False, limit=None, db_path=DEFAULT_DB_PATH):
+    """
+    Group counts for 'topic' or 'source', largest first.
+
+    Returns:
+        dict: value -> count
+    """
+    if field not in ('topic', 'source'):
+        raise ValueError(f"Cannot group by {field!r}")
+    join, where, params = _where(feed, None, None, False, require_text)
+    sql = f"SELECT a.{field}, COUNT(*) AS n FROM articles a {join} {where} GROUP BY a.{field} ORDER BY n DESC"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    return {row[0]: row[1] for row in get_connection(db_path).execute(sql, params)}
+
+def feed_updated_at(feed, db_path=DEFAULT_DB_PATH):
+    """Timestamp of the last write to `feed`, or None if it was never written."""
+    row = get_connection(db_path).execute(
+        "SELECT updated_at FROM feeds WHERE feed = ?", (feed,)
+    ).fetchone()
+    return row[0] if row else None
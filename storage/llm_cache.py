@@ -0,0 +1,149 @@
+"""
+LLM Response Cache
+Persistent, content-addressed SQLite (WAL mode) cache for LLM outputs
+(summaries, bias reports), shared by every dashboard session and process.
+
+Entries are keyed by model, system prompt, prompt template version and a
+hash of the cleaned article text, so editing a prompt (and bumping
+PROMPT_VERSION) naturally invalidates old answers.
+
+Configuration (environment):
+    LLM_CACHE_PATH         SQLite file (default: <project>/data/llm_cache.db)
+    LLM_CACHE_TTL          Entry lifetime in seconds (default: 7 days, 0 disables the cache)
+    LLM_CACHE_MAX_ENTRIES  Least recently used entries beyond this are evicted (default: 5000)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+DEFAULT_CACHE_PATH = os.getenv('LLM_CACHE_PATH', os.path.join(PROJECT_ROOT, 'data', 'llm_cache.db'))
+CACHE_TTL_SECONDS = float(os.getenv('LLM_CACHE_TTL', 7 * 24 * 3600))
+CACHE_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', 5000))
+
+# Size-based eviction runs every this many writes
+_EVICT_EVERY = 50
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    key        TEXT PRIMARY KEY,
+    kind       TEXT NOT NULL,
+    model      TEXT NOT NULL,
+    response   TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used ON llm_responses(last_used);
+"""
+
+_local = threading.local()
+_init_lock = threading.Lock()
+_initialized = set()
+
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "writes": 0}
+
+def _get_connection(db_path):
+    connections = getattr(_local, 'connections', None)
+    if connections is None:
+        connections = _local.connections = {}
+
+    conn = connections.get(db_path)
+    if conn is None:
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        conn = sqlite3.connect(db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with _init_lock:
+            if db_path not in _initialized:
+                conn.executescript(_SCHEMA)
+                _initialized.add(db_path)
+        connections[db_path] = conn
+    return conn
+
+def _count(name):
+    with _stats_lock:
+        _stats[name] += 1
+        return _stats[name]
+
+def cache_enabled():
+    return CACHE_TTL_SECONDS > 0
+
+def make_cache_key(kind, model, system_prompt, prompt_version, text):
+    """Content address of one LLM request."""
+    text_hash = hashlib.sha256((text or '').encode('utf-8')).hexdigest()
+    material = json.dumps([kind, model, system_prompt, prompt_version, text_hash])
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+def get_cached_response(key, db_path=DEFAULT_CACHE_PATH):
+    """Returns the cached response for `key` (JSON-decoded), or None on a miss/expiry."""
+    if not cache_enabled():
+        return None
+    now = time.time()
+    try:
+        conn = _get_connection(db_path)
+        row = conn.execute(
+            "SELECT response FROM llm_responses WHERE key = ? AND created_at >= ?",
+            (key, now - CACHE_TTL_SECONDS)
+        ).fetchone()
+        if row is None:
+            _count("misses")
+            return None
+        with conn:
+            conn.execute("UPDATE llm_responses SET last_used = ? WHERE key = ?", (now, key))
+    except sqlite3.Error as e:
+        print(f"LLM cache read error: {e}")
+        return None
+    _count("hits")
+    return json.loads(row[0])
+
+def store_response(key, response, kind, model, db_path=DEFAULT_CACHE_PATH):
+    """Stores a successful LLM response (any JSON-serializable value)."""
+    if not cache_enabled():
+        return
+    now = time.time()
+    try:
+        conn = _get_connection(db_path)
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, kind, model, response, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, kind, model, json.dumps(response), now, now)
+            )
+        if _count("writes") % _EVICT_EVERY == 1:
+            evict(db_path)
+    except sqlite3.Error as e:
+        print(f"LLM cache write error: {e}")
+
+def evict(db_path=DEFAULT_CACHE_PATH):
+    """Drops expired entries and the least recently used ones beyond CACHE_MAX_ENTRIES."""
+    conn = _get_connection(db_path)
+    with conn:
+        conn.execute("DELETE FROM llm_responses WHERE created_at < ?", (time.time() - CACHE_TTL_SECONDS,))
+        conn.execute(
+            "DELETE FROM llm_responses WHERE key IN ("
+            "SELECT key FROM llm_responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (CACHE_MAX_ENTRIES,)
+        )
+
+def get_llm_cache_stats(db_path=DEFAULT_CACHE_PATH):
+    """Returns hit/miss counters for this process and the number of stored entries."""
+    with _stats_lock:
+        stats = dict(_stats)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+    try:
+        stats["size"] = _get_connection(db_path).execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+    except sqlite3.Error:
+        stats["size"] = 0
+    return stats
+
+def clear_llm_cache(db_path=DEFAULT_CACHE_PATH):
+    """Deletes every cached response."""
+    conn = _get_connection(db_path)
+    with conn:
+        conn.execute("DELETE FROM llm_responses")
@@ -0,0 +1,153 @@
+"""
+Process-wide TTL + LRU Cache
+Thread-safe in-memory cache with optional on-disk persistence.
+Shared by every Streamlit session running in the same server process.
+"""
+
+import os
+import pickle
+import threading
+import time
+import atexit
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    Size-bounded LRU cache whose entries expire after `ttl` seconds.
+
+    Args:
+        max_entries: Maximum number of entries kept before evicting the least recently used
+        ttl: Entry lifetime in seconds (None = never expires)
+        path: Optional pickle file used to persist entries across restarts
+        save_interval: Minimum seconds between two disk writes
+    """
+
+    def __init__(self, max_entries=256, ttl=None, path=None, save_interval=5.0):
+        self.max_entries = max(1, int(max_entries))
+        self.ttl = ttl
+        self.path = path
+        self.save_interval = save_interval
+
+        self._data = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = 0.0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.path:
+            self._load()
+            atexit.register(self.save)
+
+    def get(self, key, default=None):
+        """Returns the cached value for `key`, or `default` on a miss/expiry."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time.time():
+                del self._data[key]
+                self._dirty = True
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def peek(self, key, default=None):
+        """Like get(), but leaves the hit/miss counters and LRU order untouched."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or (entry[0] is not None and entry[0] < time.time()):
+                return default
+            return entry[1]
+
+    def set(self, key, value):
+        """Stores `value` under `key`, evicting the oldest entries if full."""
+        expires_at = time.time() + self.ttl if self.ttl else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+            self._dirty = True
+            should_save = self.path and time.time() - self._last_save >= self.save_interval
+
+        if should_save:
+            self.save()
+
+    def clear(self):
+        """Drops every entry and resets the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+            self._dirty = True
+        if self.path:
+            self.save()
+
+    def stats(self):
+        """Returns hit/miss counters and the current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._data),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+            }
+
+    def __len__(self):
+        return len(self._data)
+
+    def save(self):
+        """Writes live entries to disk atomically (no-op without a path)."""
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            now = time.time()
+            snapshot = [
+                (key, entry) for key, entry in self._data.items()
+                if entry[0] is None or entry[0] >= now
+            ]
+            self._dirty = False
+            self._last_save = now
+
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"⚠️ Could not persist cache to {self.path}: {e}")
+
+    def _load(self):
+        """Restores non-expired entries from disk."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'rb') as f:
+                snapshot = pickle.load(f)
+        except Exception as e:
+            print(f"⚠️ Could not load cache from {self.path}: {e}")
+            return
+
+        now = time.time()
+        for key, (expires_at, value) in snapshot[-self.max_entries:]:
+            if expires_at is None or expires_at >= now:
+                self._data[key] = (expires_at, value)
+        self._last_save = now
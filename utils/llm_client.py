@@ -0,0 +1,315 @@
+"""
+Shared OpenRouter Client
+One lazily created, thread-safe OpenAI client (pointed at OpenRouter) with a
+pooled keep-alive HTTP transport and explicit timeouts, shared by the
+summarizer and bias detector. It is rebuilt only when OPENROUTER_API_KEY
+changes (e.g. a new key typed into the sidebar). Replies can be fetched
+whole (cached_completion) or token by token (CompletionStream).
+
+Configuration (environment):
+    OPENROUTER_BASE_URL         API base URL (default: https://openrouter.ai/api/v1)
+    OPENROUTER_CONNECT_TIMEOUT  Connect timeout in seconds (default: 5)
+    OPENROUTER_READ_TIMEOUT     Read timeout in seconds (default: 60)
+    OPENROUTER_MAX_RETRIES      SDK retries on 429/5xx/connection errors (default: 2)
+    OPENROUTER_POOL_SIZE        Max pooled connections (default: 16)
+    OPENROUTER_RATE_LIMIT       Requests per second across the process (default: 2, 0 = unlimited)
+    OPENROUTER_RATE_BURST       Requests allowed in a burst (default: 4)
+"""
+
+import os
+import threading
+import time
+from collections import deque
+
+from openai import OpenAI, DefaultHttpxClient, Timeout, DEFAULT_CONNECTION_LIMITS
+
+from utils.replay import get_replay_mode, replay_chat_completion
+from utils.prompts import PROMPT_VERSION
+from utils.rate_limiter import TokenBucket
+from storage.llm_cache import make_cache_key, get_cached_response, store_response
+
+OPENROUTER_BASE_URL = os.getenv('OPENROUTER_BASE_URL', 'https://openrouter.ai/api/v1')
+CONNECT_TIMEOUT = float(os.getenv('OPENROUTER_CONNECT_TIMEOUT', 5))
+READ_TIMEOUT = float(os.getenv('OPENROUTER_READ_TIMEOUT', 60))
+MAX_RETRIES = int(os.getenv('OPENROUTER_MAX_RETRIES', 2))
+POOL_SIZE = int(os.getenv('OPENROUTER_POOL_SIZE', 16))
+RATE_LIMIT = float(os.getenv('OPENROUTER_RATE_LIMIT', 2))
+RATE_BURST = float(os.getenv('OPENROUTER_RATE_BURST', 4))
+
+# Sent with every request (OpenRouter uses them for app attribution)
+OPENROUTER_HEADERS = {
+    "HTTP-Referer": "http://localhost:8501",
+    "X-Title": "News Intelligence App",
+}
+
+_client = None
+_client_key = None
+_client_lock = threading.Lock()
+
+# Every live OpenRouter request (all sessions, bulk jobs) draws from this bucket
+_rate_limiter = TokenBucket(RATE_LIMIT, RATE_BURST)
+
+# Latency of chat completion calls, in seconds
+_call_latencies = deque(maxlen=1000)
+_cold_call_latencies = deque(maxlen=100)  # first call on each new client (includes TLS handshake)
+_ttft_latencies = deque(maxlen=1000)  # time to first token of streamed calls
+_pending_cold_call = False
+
+def _resolve_api_key():
+    api_key = os.getenv("OPENROUTER_API_KEY")
+    if not api_key and get_replay_mode() == 'replay':
+        api_key = "replay"  # Responses come from fixtures; the key is never sent
+    if not api_key:
+        return None
+    return api_key.strip().strip("'").strip('"') or None
+
+def _build_client(api_key):
+    # Limits class of whichever httpx flavour this SDK version is built on
+    limits_cls = type(DEFAULT_CONNECTION_LIMITS)
+    http_client = DefaultHttpxClient(
+        timeout=Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+        limits=limits_cls(
+            max_connections=POOL_SIZE,
+            max_keepalive_connections=POOL_SIZE,
+            keepalive_expiry=90
+        )
+    )
+    return OpenAI(
+        base_url=OPENROUTER_BASE_URL,
+        api_key=api_key,
+        http_client=http_client,
+        max_retries=MAX_RETRIES
+    )
+
+def get_openai_client():
+    """
+    Returns the shared OpenRouter client, or None when no key is configured.
+    Safe to call from any thread; the client (and its connection pool) is
+    only rebuilt when the key changes.
+    """
+    global _client, _client_key, _pending_cold_call
+    api_key = _resolve_api_key()
+    if not api_key:
+        return None
+
+    with _client_lock:
+        if _client is None or api_key != _client_key:
+            # The previous client is left to in-flight calls and closed when collected
+            _client = _build_client(api_key)
+            _client_key = api_key
+            _pending_cold_call = True
+            print("🔑 OpenRouter client initialised")
+        return _client
+
+def _take_cold_call(client):
+    """True for the first call made on a freshly built client."""
+    global _pending_cold_call
+    with _client_lock:
+        cold = _pending_cold_call and client is _client
+        if cold:
+            _pending_cold_call = False
+        return cold
+
+def _record_latency(elapsed, cold):
+    _call_latencies.append(elapsed)
+    if cold:
+        _cold_call_latencies.append(elapsed)
+
+def chat_completion(client, **kwargs):
+    """
+    `client.chat.completions.create(**kwargs)` with the OpenRouter headers,
+    record/replay support and latency tracking.
+    """
+    kwargs.setdefault("extra_headers", OPENROUTER_HEADERS)
+    if get_replay_mode() != 'replay':
+        _rate_limiter.acquire()
+    cold = _take_cold_call(client)
+
+    start = time.perf_counter()
+    try:
+        return replay_chat_completion(client, **kwargs)
+    finally:
+        _record_latency(time.perf_counter() - start, cold)
+
+def _messages(system_prompt, user_prompt):
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt}
+    ]
+
+def cached_completion(client, kind, text, model, system_prompt, user_prompt, validate=None, **params):
+    """
+    Assistant reply for a system + user prompt about `text`, served from the
+    persistent LLM cache when the same model, system prompt, PROMPT_VERSION
+    and text were seen before. Record/replay runs bypass the cache so they
+    exercise the real call path.
+
+    Args:
+        client: Client from get_openai_client()
+        kind: Cache namespace ('summary', 'bias', ...)
+        text: Cleaned article text the prompt is built from
+        model / system_prompt / user_prompt: The request
+        validate: Optional check on the content; replies failing it are not cached
+        **params: Extra completion arguments (temperature, max_tokens, ...)
+
+    Returns:
+        str: Stripped message content
+    """
+    use_cache = get_replay_mode() == 'off'
+    key = make_cache_key(kind, model, system_prompt, PROMPT_VERSION, text)
+    if use_cache:
+        cached = get_cached_response(key)
+        if cached is not None:
+            return cached
+
+    response = chat_completion(client, model=model, messages=_messages(system_prompt, user_prompt), **params)
+    content = (response.choices[0].message.content or '').strip()
+    if use_cache and content and (validate is None or validate(content)):
+        store_response(key, content, kind, model)
+    return content
+
+class CompletionStream:
+    """
+    Iterable of text chunks for a streamed completion (e.g. for st.write_stream).
+
+    Cache hits are yielded in one chunk. Record/replay runs fall back to a
+    single non-streamed call, since fixtures hold whole responses. Once
+    iteration finishes:
+        content   Full reply text
+        result    parse(content), or on_error(exception) if the call failed
+        error     The exception (or static error message) when there is no real reply
+        ttft_ms   Time to first token (None for static messages)
+        total_ms  Time until the last token
+
+    Timings count from `started` (a time.perf_counter() value) when given, so
+    work done before the request, such as a map step, is included.
+        cached    True when served from the LLM cache
+
+    The finished reply is stored in the LLM cache like cached_completion().
+    """
+
+    def __init__(self, client, kind, text, model, system_prompt, user_prompt,
+                 parse=None, on_error=None, started=None, **params):
+        self.client = client
+        self.kind = kind
+        self.model = model
+        self.system_prompt = system_prompt
+        self.user_prompt = user_prompt
+        self.params = params
+        self.parse = parse
+        self.on_error = on_error
+        self.started = started
+        self.key = make_cache_key(kind, model, system_prompt, PROMPT_VERSION, text)
+        self._static = None
+        self._reset()
+
+    def _reset(self):
+        self.content = ''
+        self.result = None
+        self.error = None
+        self.ttft_ms = None
+        self.total_ms = None
+        self.cached = False
+
+    @classmethod
+    def static(cls, message, result=None, error=None):
+        """
+        A stream that just yields `message` (validation / configuration errors).
+        Pass `error` when the message stands in for a failed call, so callers
+        know not to persist the result.
+        """
+        stream = cls.__new__(cls)
+        stream.started = None
+        stream._reset()
+        stream._static = (message, message if result is None else result, error)
+        return stream
+
+    def _chunks(self, start):
+        """Yields raw text pieces from the cache, a replayed call or a live stream."""
+        use_cache = get_replay_mode() == 'off'
+        if use_cache:
+            cached = get_cached_response(self.key)
+            if cached is not None:
+                self.cached = True
+                yield cached
+                return
+
+        messages = _messages(self.system_prompt, self.user_prompt)
+        if not use_cache:
+            response = chat_completion(self.client, model=self.model, messages=messages, **self.params)
+            yield response.choices[0].message.content or ''
+            return
+
+        _rate_limiter.acquire()
+        cold = _take_cold_call(self.client)
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                stream=True,
+                extra_headers=OPENROUTER_HEADERS,
+                **self.params
+            )
+            first = True
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    if first:
+                        first = False
+                        _ttft_latencies.append(time.perf_counter() - start)
+                    yield chunk.choices[0].delta.content
+        finally:
+            _record_latency(time.perf_counter() - start, cold)
+
+    def __iter__(self):
+        if self._static is not None:
+            message, self.result, self.error = self._static
+            self.content = message
+            yield message
+            return
+
+        call_start = time.perf_counter()
+        start = call_start if self.started is None else self.started
+        pieces = []
+        try:
+            for piece in self._chunks(call_start):
+                if self.ttft_ms is None:
+                    self.ttft_ms = (time.perf_counter() - start) * 1000
+                pieces.append(piece)
+                yield piece
+        except Exception as e:
+            print(f"OpenRouter streaming error: {e}")
+            self.error = e
+            self.content = ''.join(pieces).strip()
+            self.result = self.on_error(e) if self.on_error else f"Error using OpenAI: {e}"
+            yield f"\n\n⚠️ {e}"
+            return
+        finally:
+            self.total_ms = (time.perf_counter() - start) * 1000
+
+        self.content = ''.join(pieces).strip()
+        self.result = self.parse(self.content) if self.parse else self.content
+        if not self.cached and self.content and get_replay_mode() == 'off':
+            store_response(self.key, self.content, self.kind, self.model)
+
+def get_llm_latency_stats():
+    """
+    Returns p50/p99 latency (ms) of recent chat completions, the mean latency
+    of first calls on a fresh client (connection + TLS setup included) and the
+    p50 time to first token of streamed calls.
+    """
+    samples = sorted(_call_latencies)
+    cold = list(_cold_call_latencies)
+    ttft = sorted(_ttft_latencies)
+    if not samples:
+        return {"count": 0, "p50_ms": 0.0, "p99_ms": 0.0, "cold_call_ms": 0.0, "ttft_p50_ms": 0.0}
+
+    def percentile(values, p):
+        return values[min(len(values) - 1, int(p * len(values)))] * 1000 if values else 0.0
+
+    return {
+        "count": len(samples),
+        "p50_ms": percentile(samples, 0.50),
+        "p99_ms": percentile(samples, 0.99),
+        "cold_call_ms": sum(cold) / len(cold) * 1000 if cold else 0.0,
+        "ttft_p50_ms": percentile(ttft, 0.50)
+    }
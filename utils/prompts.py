@@ -2,12 +2,28 @@
 Centralized Prompt Templates for OpenAI features
 """
 
+# Bump whenever a prompt or template below changes: it is part of the LLM
+# response cache key, so stale summaries / bias reports stop being served.
+PROMPT_VERSION = 1
+
 # ----------------- SUMMARIZATION -----------------
 SUMMARIZATION_SYSTEM_PROMPT = "You are a senior editor at a top-tier news agency (like Reuters or Bloomberg). Your goal is to provide a comprehensive, fact-heavy summary of the provided news article. Focus on the 'Who, What, When, Where, Why' and key outcomes. Do not use phrases like 'The article discusses'. Just state the facts directly."
 
 def get_summary_prompt(text):
     return f"Please summarize this article:\n\n{text}"
 
+# Long articles: each section is summarized on its own (map), then merged (reduce)
+def get_chunk_summary_prompt(text, index, total):
+    return f"""This is part {index} of {total} of a long news article. Summarize this part, keeping every key fact, name, number and quote, so it can be merged with the summaries of the other parts:
+
+{text}"""
+
+def get_reduce_summary_prompt(partial_summaries):
+    parts = "\n\n".join(f"Part {i}:\n{summary}" for i, summary in enumerate(partial_summaries, start=1))
+    return f"""Below are summaries of consecutive parts of one news article. Merge them into a single summary of the whole article, removing repetition and keeping the most important facts:
+
+{parts}"""
+
 
 # ----------------- BIAS DETECTION -----------------
 BIAS_SYSTEM_PROMPT = "You are a neutral, objective media analyst. Detect bias based on evidence, not opinion."
@@ -25,3 +41,38 @@ Output Format:
 Label: [Left-Leaning / Right-Leaning / Neutral / Balanced]
 Confidence: [High/Medium/Low]
 Analysis: [Provide a bulleted list of 3-4 key observations citing specific words or framing used in the text.]"""
+
+
+# ----------------- COMBINED ANALYSIS (SINGLE CALL) -----------------
+BIAS_LABELS = ["Left-Leaning", "Right-Leaning", "Neutral", "Balanced"]
+
+COMBINED_SYSTEM_PROMPT = (
+    "You are a senior editor and a neutral media analyst. For the provided news article, "
+    "write a comprehensive, fact-heavy summary (Who, What, When, Where, Why and key outcomes, "
+    "stated directly without phrases like 'The article discusses') and assess its bias based on "
+    "evidence, not opinion. Reply with JSON only."
+)
+
+# JSON schema for structured outputs (response_format=json_schema, strict mode)
+COMBINED_ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "bias_label": {"type": "string", "enum": BIAS_LABELS},
+        "confidence": {"type": "number", "description": "0 to 1"},
+        "observations": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["summary", "bias_label", "confidence", "observations"],
+    "additionalProperties": False
+}
+
+def get_combined_analysis_prompt(text):
+    return f"""Analyze the following news article.
+
+1. summary: a professional summary of the article.
+2. bias_label: political leaning / framing, one of {', '.join(BIAS_LABELS)}.
+3. confidence: your confidence in bias_label, from 0 to 1.
+4. observations: 3-4 key observations about loaded language, emotional framing or omitted viewpoints, citing specific words or framing used in the text.
+
+Target Article:
+{text}"""
@@ -0,0 +1,59 @@
+"""
+Token Bucket Rate Limiter
+Thread-safe limiter shared by every caller of an upstream API, so bursts
+from bulk jobs and concurrent sessions stay under the provider's limits.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Allows `rate` acquisitions per second on average, with bursts of up to
+    `capacity`.
+
+    Args:
+        rate: Refill rate in tokens per second (<= 0 disables limiting)
+        capacity: Bucket size (default: max(1, rate))
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited = 0.0  # total seconds callers spent blocked
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens=1, timeout=None):
+        """
+        Blocks until `tokens` are available and takes them.
+
+        Returns:
+            bool: False if `timeout` seconds passed first
+        """
+        if self.rate <= 0:
+            return True
+
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    self.waited += now - start
+                    return True
+                wait = (tokens - self._tokens) / self.rate
+
+            if timeout is not None:
+                remaining = timeout - (time.monotonic() - start)
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
@@ -0,0 +1,89 @@
+"""
+Record / Replay for External APIs
+Records NewsAPI and OpenRouter responses into a local fixture directory and
+replays them (with optional injected latency) so the fetch -> process ->
+analyze pipeline can be benchmarked offline and without spending quota.
+
+Configuration (environment):
+    REPLAY_MODE        off (default) | record | replay
+    REPLAY_DIR         Fixture directory (default: <project>/data/fixtures)
+    REPLAY_LATENCY_MS  Delay added to every replayed response (default: 0)
+"""
+
+import hashlib
+import json
+import os
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+class FixtureNotFoundError(LookupError):
+    """Raised in replay mode when no recording exists for a request."""
+
+def get_replay_mode():
+    """Current mode; read on every call so it can be switched at runtime."""
+    mode = os.getenv('REPLAY_MODE', 'off').strip().lower()
+    return mode if mode in ('record', 'replay') else 'off'
+
+def _fixture_path(namespace, request):
+    key = hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    fixture_dir = os.getenv('REPLAY_DIR', os.path.join(PROJECT_ROOT, 'data', 'fixtures'))
+    return os.path.join(fixture_dir, namespace, f"{key[:32]}.json")
+
+def call_with_replay(namespace, request, fn, serialize=None, deserialize=None):
+    """
+    Runs `fn()` according to the replay mode.
+
+    Args:
+        namespace: Fixture sub-directory ('newsapi', 'openrouter', ...)
+        request: JSON-serializable description of the call (the fixture key)
+        fn: Performs the live call
+        serialize / deserialize: Convert the response to and from JSON-compatible data
+
+    Returns:
+        The live or replayed response
+    """
+    mode = get_replay_mode()
+    if mode == 'off':
+        return fn()
+
+    path = _fixture_path(namespace, request)
+
+    if mode == 'replay':
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)['response']
+        except OSError:
+            raise FixtureNotFoundError(f"No {namespace} recording for {request!r} ({path})")
+        latency_ms = float(os.getenv('REPLAY_LATENCY_MS', 0))
+        if latency_ms > 0:
+            time.sleep(latency_ms / 1000.0)
+        return deserialize(data) if deserialize else data
+
+    response = fn()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'request': request,
+            'response': serialize(response) if serialize else response,
+            'recorded_at': time.time()
+        }, f, default=str)
+    os.replace(tmp_path, path)
+    return response
+
+def replay_chat_completion(client, **kwargs):
+    """
+    `client.chat.completions.create(**kwargs)` with record/replay support.
+    Transport-only arguments (extra_headers, timeout) are not part of the fixture key.
+    """
+    from openai.types.chat import ChatCompletion
+
+    request = {k: v for k, v in kwargs.items() if k not in ('extra_headers', 'timeout')}
+    return call_with_replay(
+        'openrouter',
+        request,
+        lambda: client.chat.completions.create(**kwargs),
+        serialize=lambda response: response.model_dump(),
+        deserialize=ChatCompletion.model_validate
+    )
@@ -0,0 +1,72 @@
+"""
+Single-Flight Request Coalescing
+Concurrent callers asking for the same key share one in-flight call.
+"""
+
+import threading
+
+
+class _Call:
+    """An in-flight call and the callers waiting on it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Thread-safe duplicate call suppression.
+
+    While a call for `key` is running, further `do(key, fn)` calls block and
+    receive the same result (or exception) instead of calling `fn` again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.shared = 0  # Number of calls served by someone else's request
+
+    def do(self, key, fn, *args, **kwargs):
+        """
+        Runs `fn(*args, **kwargs)` once per key among concurrent callers.
+
+        Returns:
+            The result of the (possibly shared) call; re-raises its exception.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except Exception as e:
+            call.error = e
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def in_flight(self):
+        """Returns the number of keys currently being fetched."""
+        with self._lock:
+            return len(self._calls)